@@ -3,13 +3,200 @@ Base service class for AWS service discovery implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
+import queue
+import re
+import threading
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .resource_info import ResourceInfo
 from .config import DiscoveryConfig
+from .resource_config import get_resource_config
+from .type_cache import get_unsupported_type_cache, UNSUPPORTED_ERROR_CODES
+from utils import json_utils
+
+
+# Largest page Cloud Control list_resources accepts (MaxResults)
+LIST_RESOURCES_PAGE_SIZE = 100
+
+# Number of pages fetched ahead of the consumer
+PREFETCH_PAGES = 2
+
+_PREFETCH_DONE = object()
+
+
+def prefetch(iterable: Iterable, buffer_size: int = PREFETCH_PAGES) -> Iterator:
+    """
+    Iterate over an iterable while a background thread reads ahead.
+    
+    Lets parsing of one page overlap with the network round trip for the next.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+    
+    def _put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except BaseException as e:
+            _put((_PREFETCH_DONE, e))
+            return
+        _put((_PREFETCH_DONE, None))
+    
+    producer = threading.Thread(target=_produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Release the producer if the consumer stops early
+        stopped.set()
+
+
+# Common ARN field names, in priority order
+ARN_FIELDS = ('Arn', 'ARN', 'arn', 'ResourceArn', 'resource_arn')
+_ARN_FIELD_SET = frozenset(ARN_FIELDS)
+
+# Services whose resources are not tied to a region
+GLOBAL_SERVICES = frozenset({'iam', 'organizations', 'route53', 'waf', 'wafv2', 'artifacts', 'controltower'})
+
+# Error message fragments (lowercase) for which a resource type is skipped rather than reported
+SKIP_ERROR_PATTERNS = (
+    # Rate limiting and throttling
+    'throttlingexception',
+    'rate exceeded',
+    'too many requests',
+    
+    # Missing required parameters (common Cloud Control API issues)
+    'required key',
+    'required property',
+    'missing or invalid resourcemodel property',
+    'property cannot be empty',
+    'autoscalinggroupname is required',
+    'certificatearn cannot be empty',
+    'transitgatewaymulticastdomainid',
+    'domainidentifier',
+    'projectidentifier',
+    'environmentidentifier',
+    'identitypoolid',
+    'identityprovidername',
+    
+    # Service not available or not supported
+    'does not support list action',
+    'unsupportedactionexception',
+    'typenotfoundexception',
+    'cannot be found',
+    'operation is not supported',
+    'feature is not available',
+    
+    # Access and subscription issues
+    'subscription does not exist',
+    'not registered as a publisher',
+    'access grants instance does not exist',
+    'cost category',
+    'linked account doesn\'t have access',
+    'controltower could not complete',
+    'awscontroltoweradmin',
+    
+    # Service-specific limitations
+    'failed to list cost categories',
+    'error occurred during operation',
+    'handler returned status failed',
+    'generalserviceexception'
+)
+
+# All skip error patterns as one alternation, so an error message is scanned once
+_SKIP_ERROR_RE = re.compile('|'.join(re.escape(pattern) for pattern in SKIP_ERROR_PATTERNS), re.IGNORECASE)
+
+
+# Thread pool shared by all services for per-type Cloud Control calls, so the
+# total number of in-flight calls stays at max_workers however many services run
+_type_executor = None
+_type_executor_lock = threading.Lock()
+
+
+def get_type_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get the shared resource type discovery pool, creating it on first use"""
+    global _type_executor
+    with _type_executor_lock:
+        if _type_executor is None:
+            _type_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="discover-type")
+        return _type_executor
+
+
+def shutdown_type_executor():
+    """Shut down the shared resource type discovery pool"""
+    global _type_executor
+    with _type_executor_lock:
+        if _type_executor is not None:
+            _type_executor.shutdown(wait=True)
+            _type_executor = None
+
+
+# Fail fast on unreachable endpoints but give slow list/describe calls time to finish
+CLIENT_CONNECT_TIMEOUT = 5
+CLIENT_READ_TIMEOUT = 30
+
+
+@lru_cache(maxsize=None)
+def get_client_config(max_pool_connections: int = 10) -> Config:
+    """Get the botocore config shared by all AWS clients with the given pool size"""
+    return Config(
+        max_pool_connections=max_pool_connections,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        connect_timeout=CLIENT_CONNECT_TIMEOUT,
+        read_timeout=CLIENT_READ_TIMEOUT,
+        tcp_keepalive=True
+    )
+
+
+# AWS clients are thread-safe, so every service instance and the graph loader
+# share one client (and connection pool) per session, service and region
+_shared_clients = {}
+
+# boto3 sessions are not thread-safe for client creation, so creation is serialized
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(session: boto3.Session, service_name: str, region: str,
+                      config: Optional[Config] = None):
+    """Get the shared AWS client for a session, service and region, creating it once"""
+    key = (session, service_name, region)
+    client = _shared_clients.get(key)
+    if client is not None:
+        return client
+    
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = session.client(
+                service_name,
+                region_name=region,
+                config=config or get_client_config()
+            )
+            _shared_clients[key] = client
+        return client
 
 
 class BaseAWSService(ABC):
@@ -22,17 +209,26 @@ class BaseAWSService(ABC):
         self.region = config.region
         self.logger = logging.getLogger(f'aws_discovery.{self.get_service_name()}')
         
-        # Service-specific client cache
-        self._clients = {}
+        # Clients come from the shared cache, created with this config on first use
+        self._client_config = self._build_client_config()
         
-        # Service statistics
+        # Service statistics (updated from discovery worker threads)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'resource_types_discovered': 0,
             'resources_found': 0,
+            'resources_with_arns': 0,
             'resources_with_errors': 0,
             'api_calls_made': 0,
             'skipped_resource_types': 0
         }
+        
+        # Service-specific skip patterns flattened to resource type -> category
+        self._skip_type_categories = {
+            resource_type: category
+            for category, resource_types in self.get_skip_patterns().items()
+            for resource_type in resource_types
+        }
     
     @abstractmethod
     def get_service_name(self) -> str:
@@ -49,86 +245,53 @@ class BaseAWSService(ABC):
         """Discover all resources for this service"""
         pass
     
+    def _build_client_config(self) -> Config:
+        """Get botocore config whose connection pool matches the discovery fan-out"""
+        # botocore defaults to 10 pooled connections; with more workers than
+        # that, threads wait on a fresh TLS handshake for every call
+        return get_client_config(max(10, self.config.max_workers))
+    
+    def get_resource_types_to_discover(self) -> List[str]:
+        """Get supported resource types after applying the configured include/exclude lists"""
+        return get_resource_config().filter_resource_types(self.get_supported_resource_types())
+    
     def get_client(self, service_name: str = None):
         """Get cached AWS client for service"""
         if service_name is None:
             service_name = self.get_service_name()
         
-        if service_name not in self._clients:
-            try:
-                self._clients[service_name] = self.session.client(
-                    service_name, 
-                    region_name=self.region
-                )
-            except Exception as e:
-                self.logger.error(f"Failed to create {service_name} client: {e}")
-                raise
-        
-        return self._clients[service_name]
+        try:
+            return get_shared_client(self.session, service_name, self.region, self._client_config)
+        except Exception as e:
+            self.logger.error(f"Failed to create {service_name} client: {e}")
+            raise
+    
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Thread-safe increment of a service statistic"""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _add_stats(self, **amounts: int):
+        """Thread-safe update of several service statistics under one lock acquisition"""
+        with self._stats_lock:
+            for key, amount in amounts.items():
+                self.stats[key] += amount
     
     def should_skip_resource_type(self, resource_type: str, error_msg: str = "") -> bool:
         """Determine if a resource type should be skipped based on known patterns"""
         # Check service-specific skip patterns
-        skip_patterns = self.get_skip_patterns()
-        
-        for category, resource_types in skip_patterns.items():
-            if resource_type in resource_types:
-                self.logger.info(f"⚠ Skipping {resource_type}: Known {category} issue")
-                self.stats['skipped_resource_types'] += 1
-                return True
+        category = self._skip_type_categories.get(resource_type)
+        if category is not None:
+            self.logger.info(f"⚠ Skipping {resource_type}: Known {category} issue")
+            self._increment_stat('skipped_resource_types')
+            return True
         
         # Check error message patterns
-        error_lower = error_msg.lower()
-        
-        skip_error_patterns = [
-            # Rate limiting and throttling
-            'throttlingexception',
-            'rate exceeded',
-            'too many requests',
-            
-            # Missing required parameters (common Cloud Control API issues)
-            'required key',
-            'required property',
-            'missing or invalid resourcemodel property',
-            'property cannot be empty',
-            'autoscalinggroupname is required',
-            'certificatearn cannot be empty',
-            'transitgatewaymulticastdomainid',
-            'domainidentifier',
-            'projectidentifier',
-            'environmentidentifier',
-            'identitypoolid',
-            'identityprovidername',
-            
-            # Service not available or not supported
-            'does not support list action',
-            'unsupportedactionexception',
-            'typenotfoundexception',
-            'cannot be found',
-            'operation is not supported',
-            'feature is not available',
-            
-            # Access and subscription issues
-            'subscription does not exist',
-            'not registered as a publisher',
-            'access grants instance does not exist',
-            'cost category',
-            'linked account doesn\'t have access',
-            'controltower could not complete',
-            'awscontroltoweradmin',
-            
-            # Service-specific limitations
-            'failed to list cost categories',
-            'error occurred during operation',
-            'handler returned status failed',
-            'generalserviceexception'
-        ]
-        
-        for pattern in skip_error_patterns:
-            if pattern in error_lower:
-                self.logger.info(f"⚠ Skipping {resource_type}: {pattern}")
-                self.stats['skipped_resource_types'] += 1
-                return True
+        match = _SKIP_ERROR_RE.search(error_msg) if error_msg else None
+        if match:
+            self.logger.info(f"⚠ Skipping {resource_type}: {match.group(0).lower()}")
+            self._increment_stat('skipped_resource_types')
+            return True
         
         return False
     
@@ -148,13 +311,23 @@ class BaseAWSService(ABC):
             if self.should_skip_resource_type(resource_type):
                 return []
             
+            if get_unsupported_type_cache().is_unsupported(self.config.region, resource_type):
+                self.logger.debug("⚠ Skipping %s: cached as unsupported in %s", resource_type, self.config.region)
+                self._increment_stat('skipped_resource_types')
+                return []
+            
             resources = []
             cloudcontrol_client = self.get_client('cloudcontrol')
             
             paginator = cloudcontrol_client.get_paginator('list_resources')
-            page_iterator = paginator.paginate(TypeName=resource_type)
+            page_iterator = paginator.paginate(
+                TypeName=resource_type,
+                PaginationConfig={'PageSize': LIST_RESOURCES_PAGE_SIZE}
+            )
+            
+            arn_count = 0
             
-            for page in page_iterator:
+            for page in prefetch(page_iterator):
                 if 'ResourceDescriptions' in page:
                     for resource_desc in page['ResourceDescriptions']:
                         resource_info = self._parse_resource_description(
@@ -162,15 +335,21 @@ class BaseAWSService(ABC):
                         )
                         if resource_info:
                             resources.append(resource_info)
+                            if resource_info.arn:
+                                arn_count += 1
             
-            self.stats['api_calls_made'] += 1
-            self.stats['resource_types_discovered'] += 1
-            self.stats['resources_found'] += len(resources)
+            # Counts are tallied locally per type and folded into stats once
+            self._add_stats(
+                api_calls_made=1,
+                resource_types_discovered=1,
+                resources_found=len(resources),
+                resources_with_arns=arn_count
+            )
             
             if resources:
                 self.logger.info(f"✓ {resource_type}: Found {len(resources)} resources")
             else:
-                self.logger.debug(f"○ {resource_type}: No resources found")
+                self.logger.debug("○ %s: No resources found", resource_type)
             
             return resources
             
@@ -178,6 +357,9 @@ class BaseAWSService(ABC):
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_msg = str(e)
             
+            if error_code in UNSUPPORTED_ERROR_CODES:
+                get_unsupported_type_cache().mark_unsupported(self.config.region, resource_type)
+            
             if self.should_skip_resource_type(resource_type, error_msg):
                 return []
             
@@ -189,7 +371,7 @@ class BaseAWSService(ABC):
                 identifier="ERROR",
                 error=f"{error_code}: {error_msg}"
             )
-            self.stats['resources_with_errors'] += 1
+            self._increment_stat('resources_with_errors')
             return [error_resource]
         
         except Exception as e:
@@ -199,9 +381,51 @@ class BaseAWSService(ABC):
                 identifier="ERROR",
                 error=str(e)
             )
-            self.stats['resources_with_errors'] += 1
+            self._increment_stat('resources_with_errors')
             return [error_resource]
     
+    def discover_resource_types(self, resource_types: List[str]) -> List[ResourceInfo]:
+        """Discover several resource types concurrently, preserving input order"""
+        resources = []
+        for type_resources in self.discover_resource_types_by_type(resource_types).values():
+            resources.extend(type_resources)
+        return resources
+    
+    def discover_resource_types_by_type(self, resource_types: List[str]) -> Dict[str, List[ResourceInfo]]:
+        """
+        Discover several resource types concurrently.
+        
+        Cloud Control calls are network-bound, so resource types are fanned out
+        over the thread pool shared by all services, sized by max_workers.
+        
+        Returns:
+            Mapping of resource type to discovered resources, in input order
+        """
+        if not resource_types:
+            return {}
+        
+        workers = min(self.config.max_workers, len(resource_types))
+        if workers <= 1:
+            results = [self._discover_resource_type_guarded(rt) for rt in resource_types]
+        else:
+            executor = get_type_executor(self.config.max_workers)
+            results = list(executor.map(self._discover_resource_type_guarded, resource_types))
+        
+        return dict(zip(resource_types, results))
+    
+    def _discover_resource_type_guarded(self, resource_type: str) -> List[ResourceInfo]:
+        """Discover a resource type, converting unexpected failures into an error resource"""
+        try:
+            return self.discover_resource_type(resource_type)
+        except Exception as e:
+            self.logger.error(f"✗ Failed to discover {resource_type}: {e}")
+            return [ResourceInfo(
+                resource_type=resource_type,
+                identifier="ERROR",
+                error=str(e),
+                region="" if self.is_global_service() else self.region
+            )]
+    
     def _parse_resource_description(self, resource_type: str, resource_desc: Dict[str, Any]) -> Optional[ResourceInfo]:
         """Parse resource description from Cloud Control API response"""
         try:
@@ -210,10 +434,9 @@ class BaseAWSService(ABC):
             
             # Parse properties if it's a JSON string
             if isinstance(properties, str):
-                import json
                 try:
-                    properties = json.loads(properties)
-                except json.JSONDecodeError:
+                    properties = json_utils.loads(properties)
+                except json_utils.JSONDecodeError:
                     self.logger.warning(f"Failed to parse properties JSON for {resource_type}:{identifier}")
                     properties = {}
             
@@ -234,19 +457,23 @@ class BaseAWSService(ABC):
     
     def _extract_arn(self, properties: Dict[str, Any]) -> str:
         """Extract ARN from resource properties"""
-        # Common ARN field names
-        arn_fields = ['Arn', 'ARN', 'arn', 'ResourceArn', 'resource_arn']
+        if not isinstance(properties, dict):
+            return ""
+        
+        # Most resources carry none of the ARN fields, so gate on one set intersection
+        present = properties.keys() & _ARN_FIELD_SET
+        if not present:
+            return ""
         
-        for field in arn_fields:
-            if field in properties and properties[field]:
+        for field in ARN_FIELDS:
+            if field in present and properties[field]:
                 return str(properties[field])
         
         return ""
     
     def is_global_service(self) -> bool:
         """Check if this service is global (not region-specific)"""
-        global_services = {'iam', 'organizations', 'route53', 'waf', 'wafv2', 'artifacts', 'controltower'}
-        return self.get_service_name().lower() in global_services
+        return self.get_service_name().lower() in GLOBAL_SERVICES
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get service discovery statistics"""
@@ -264,7 +491,7 @@ class BaseAWSService(ABC):
         
         self.logger.info(f"📊 {service_name} Discovery Statistics:")
         self.logger.info(f"   Resource Types: {stats['resource_types_discovered']}")
-        self.logger.info(f"   Resources Found: {stats['resources_found']}")
+        self.logger.info(f"   Resources Found: {stats['resources_found']} ({stats['resources_with_arns']} with ARN)")
         self.logger.info(f"   API Calls: {stats['api_calls_made']}")
         
         if stats['resources_with_errors'] > 0:
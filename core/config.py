@@ -23,10 +23,13 @@ class DiscoveryConfig:
     individual_descriptions: bool = False
     service_filter: Optional[str] = None
     exclude_resources: Optional[List[str]] = None
+    resource_types: Optional[List[str]] = None
+    use_type_cache: bool = True
     
     # Output Settings
     output_formats: List[str] = None
     output_dir: Optional[str] = None
+    compress_output: bool = False
     
     # Neo4j Configuration
     update_graph: bool = False
@@ -34,7 +37,9 @@ class DiscoveryConfig:
     graph_db_url: str = "localhost:7687"
     graph_db_user: str = "neo4j"
     graph_db_password: str = "Mh123456"
+    graph_db_name: str = "neo4j"
     account_name: Optional[str] = None
+    graph_writers: int = 4
     
     # Logging Configuration
     log_level: str = "INFO"
@@ -63,6 +68,8 @@ class DiscoveryConfig:
             self.graph_db_user = os.getenv('NEO4J_USER')
         if os.getenv('NEO4J_PASSWORD'):
             self.graph_db_password = os.getenv('NEO4J_PASSWORD')
+        if os.getenv('NEO4J_DATABASE'):
+            self.graph_db_name = os.getenv('NEO4J_DATABASE')
         
         # Logging level from environment
         if os.getenv('LOG_LEVEL'):
@@ -70,7 +77,7 @@ class DiscoveryConfig:
     
     def _validate(self):
         """Validate configuration settings"""
-        valid_formats = {'json', 'csv', 'excel', 'html'}
+        valid_formats = {'json', 'jsonl', 'csv', 'excel', 'html'}
         for fmt in self.output_formats:
             if fmt not in valid_formats:
                 raise ValueError(f"Invalid output format: {fmt}. Valid formats: {valid_formats}")
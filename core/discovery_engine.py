@@ -12,11 +12,17 @@ from collections import Counter
 
 from core.config import DiscoveryConfig
 from core.resource_info import ResourceInfo
-from core.resource_config import initialize_resource_config
+from core.resource_config import initialize_resource_config, is_type_pattern
+from core.base_service import shutdown_type_executor, get_client_config
+from core.type_cache import initialize_unsupported_type_cache, get_unsupported_type_cache
 from services.service_registry import ServiceFactory
 from graph.neo4j_client import Neo4jClient
 from exporters.json_exporter import JSONExporter
-from utils.logging_setup import setup_logging, TimedLogger, ProgressLogger, log_system_info, log_configuration, configure_third_party_loggers
+from exporters.jsonl_exporter import JSONLExporter
+from exporters.csv_exporter import CSVExporter
+from exporters.excel_exporter import ExcelExporter
+from exporters.html_exporter import HTMLExporter
+from utils.logging_setup import setup_logging, shutdown_logging, TimedLogger, ProgressLogger, log_system_info, log_configuration, configure_third_party_loggers
 
 
 class DiscoveryEngine:
@@ -44,9 +50,16 @@ class DiscoveryEngine:
         log_configuration(self.logger, config)
         
         # Initialize resource configuration
-        initialize_resource_config(
-            excluded_types=config.exclude_resources
+        unknown_types = initialize_resource_config(
+            excluded_types=config.exclude_resources,
+            included_types=config.resource_types,
+            type_pattern=config.service_filter if is_type_pattern(config.service_filter) else None
         )
+        if unknown_types:
+            self.logger.warning(f"⚠️  {len(unknown_types)} requested resource types are not recognised and will be skipped")
+        
+        # Remember resource types Cloud Control cannot list in this region across runs
+        initialize_unsupported_type_cache(enabled=config.use_type_cache)
         
         # Initialize AWS session
         self.session = boto3.Session(profile_name=config.profile) if config.profile else boto3.Session()
@@ -57,7 +70,7 @@ class DiscoveryEngine:
         self.neo4j_client = None
         
         if config.is_neo4j_enabled():
-            self.neo4j_client = Neo4jClient(config)
+            self.neo4j_client = Neo4jClient(config, self.session)
         
         # Discovery statistics
         self.stats = {
@@ -197,7 +210,7 @@ class DiscoveryEngine:
             return self._account_id
         
         try:
-            sts_client = self.session.client('sts')
+            sts_client = self.session.client('sts', config=get_client_config())
             response = sts_client.get_caller_identity()
             self._account_id = response['Account']
             
@@ -278,23 +291,43 @@ class DiscoveryEngine:
         json_exporter = JSONExporter(self.config, self.output_dir)
         exporters.append(json_exporter)
         
-        # TODO: Add other exporters (CSV, Excel, HTML) when implemented
+        if self.config.should_export_format('jsonl'):
+            exporters.append(JSONLExporter(self.config, self.output_dir))
+        
+        if self.config.should_export_format('csv'):
+            exporters.append(CSVExporter(self.config, self.output_dir))
+        
+        # Excel is opt-in because it needs openpyxl
+        if self.config.should_export_format('excel'):
+            exporters.append(ExcelExporter(self.config, self.output_dir))
+        
+        if self.config.should_export_format('html'):
+            exporters.append(HTMLExporter(self.config, self.output_dir))
         
         return exporters
     
     def _update_final_statistics(self, resources: List[ResourceInfo]):
         """Update final discovery statistics"""
-        self.stats['total_resources'] = len(resources)
-        self.stats['valid_resources'] = sum(1 for r in resources if r.is_valid())
-        self.stats['resources_with_errors'] = sum(1 for r in resources if r.has_error())
+        valid_resources = 0
+        resources_with_errors = 0
+        resources_by_service = self.stats['resources_by_service']
+        resources_by_region = self.stats['resources_by_region']
         
-        # Count by service and region
+        # Count validity, service and region in a single pass
         for resource in resources:
+            if resource.has_error():
+                resources_with_errors += 1
+            elif resource.identifier:
+                valid_resources += 1
+            
             if resource.service:
-                self.stats['resources_by_service'][resource.service] += 1
+                resources_by_service[resource.service] += 1
             
-            region = resource.region or 'global'
-            self.stats['resources_by_region'][region] += 1
+            resources_by_region[resource.region or 'global'] += 1
+        
+        self.stats['total_resources'] = len(resources)
+        self.stats['valid_resources'] = valid_resources
+        self.stats['resources_with_errors'] = resources_with_errors
     
     def _log_final_statistics(self):
         """Log final discovery statistics"""
@@ -313,12 +346,12 @@ class DiscoveryEngine:
         # Log top services
         top_services = self.stats['resources_by_service'].most_common(5)
         if top_services:
-            self.logger.info(f"   Top Services: {', '.join([f'{s}({c})' for s, c in top_services])}")
+            self.logger.info(f"   Top Services: {', '.join(f'{s}({c})' for s, c in top_services)}")
         
         # Log regions
-        regions = list(self.stats['resources_by_region'].keys())
-        if len(regions) > 1:
-            self.logger.info(f"   Regions: {', '.join(regions)}")
+        resources_by_region = self.stats['resources_by_region']
+        if len(resources_by_region) > 1:
+            self.logger.info(f"   Regions: {', '.join(resources_by_region)}")
         
         # Log exported files
         if self.stats['exported_files']:
@@ -335,6 +368,12 @@ class DiscoveryEngine:
     def cleanup(self):
         """Cleanup resources and prevent thread leaks"""
         try:
+            # Stop the shared resource type discovery threads
+            shutdown_type_executor()
+            
+            # Persist newly found unsupported resource types
+            get_unsupported_type_cache().save()
+            
             # Close Neo4j connection
             if self.neo4j_client:
                 self.neo4j_client.close()
@@ -347,6 +386,9 @@ class DiscoveryEngine:
             
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
+        
+        # Drain queued log records before the process exits
+        shutdown_logging()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get discovery statistics"""
@@ -5,15 +5,30 @@ Handles loading AWS resource types from configuration files and provides
 filtering capabilities based on user preferences.
 """
 
-import json
+import fnmatch
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 import logging
 
+from utils import json_utils
+
 logger = logging.getLogger(__name__)
 
 
+def is_type_pattern(service_filter: Optional[str]) -> bool:
+    """Check whether a --filter value is a resource type pattern (e.g., "AWS::EC2::*") rather than a service name"""
+    return bool(service_filter) and '::' in service_filter
+
+
+@lru_cache(maxsize=64)
+def type_pattern_matcher(pattern: str):
+    """Compile a resource type glob such as AWS::EC2::* into a case-insensitive regex"""
+    return re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+
 class ResourceTypeConfig:
     """Manages AWS resource type configuration and filtering"""
     
@@ -25,7 +40,10 @@ class ResourceTypeConfig:
             config_path: Path to the configuration file. If None, uses default location.
         """
         self._resource_types = []
+        self._resource_types_set = frozenset()
+        self._types_by_service = {}
         self._excluded_types = set()
+        self._included_types = None
         self._loaded = False
         
         if config_path is None:
@@ -34,7 +52,11 @@ class ResourceTypeConfig:
             config_path = project_root / "config" / "aws_resource_types.json"
         
         self._config_path = Path(config_path)
-        self._load_configuration()
+    
+    def _ensure_loaded(self):
+        """Load resource types on first access instead of at construction time"""
+        if not self._loaded:
+            self._load_configuration()
     
     def _load_configuration(self):
         """Load resource types from configuration file"""
@@ -45,13 +67,14 @@ class ResourceTypeConfig:
                 self._load_fallback_types()
                 return
             
-            with open(self._config_path, 'r') as f:
-                config_data = json.load(f)
+            with open(self._config_path, 'rb') as f:
+                config_data = json_utils.loads(f.read())
             
             if 'aws_resource_types' not in config_data:
                 raise ValueError("Configuration file must contain 'aws_resource_types' key")
             
             self._resource_types = config_data['aws_resource_types']
+            self._build_indexes()
             self._loaded = True
             
             logger.info(f"Loaded {len(self._resource_types)} resource types from {self._config_path}")
@@ -75,11 +98,24 @@ class ResourceTypeConfig:
             "AWS::EKS::Cluster",
             "AWS::ElasticLoadBalancingV2::LoadBalancer"
         ]
+        self._build_indexes()
         self._loaded = True
         logger.warning(f"Using fallback configuration with {len(self._resource_types)} resource types")
     
+    def _build_indexes(self):
+        """Build the membership set and the service prefix -> resource types index"""
+        self._resource_types_set = frozenset(self._resource_types)
+        
+        types_by_service = {}
+        for resource_type in self._resource_types:
+            parts = resource_type.split("::")
+            if len(parts) >= 3:
+                types_by_service.setdefault(parts[1].lower(), []).append(resource_type)
+        self._types_by_service = types_by_service
+    
     def get_all_resource_types(self) -> List[str]:
         """Get all configured AWS resource types"""
+        self._ensure_loaded()
         return self._resource_types.copy()
     
     def set_excluded_types(self, excluded_types: Optional[List[str]] = None):
@@ -93,44 +129,84 @@ class ResourceTypeConfig:
         if excluded_types:
             logger.info(f"Excluding {len(excluded_types)} resource types: {excluded_types}")
     
-    def get_filtered_resource_types(self, service_filter: Optional[str] = None) -> List[str]:
+    def set_included_types(self, included_types: Optional[List[str]] = None) -> List[str]:
+        """
+        Restrict discovery to an explicit list of resource types
+        
+        Args:
+            included_types: Resource types to discover. None discovers all types.
+            
+        Returns:
+            Requested resource types that are not in the configuration
+        """
+        if included_types is None:
+            self._included_types = None
+            return []
+        
+        self._ensure_loaded()
+        unknown_types = [rt for rt in included_types if rt not in self._resource_types_set]
+        if unknown_types:
+            logger.warning(f"Ignoring {len(unknown_types)} unknown resource types: {unknown_types}")
+        
+        self._included_types = frozenset(rt for rt in included_types if rt in self._resource_types_set)
+        logger.info(f"Restricting discovery to {len(self._included_types)} resource types")
+        return unknown_types
+    
+    def set_type_pattern(self, pattern: str) -> List[str]:
         """
-        Get filtered list of resource types based on service filter and exclusions
+        Restrict discovery to the resource types matching a pattern such as AWS::EC2::*
         
         Args:
-            service_filter: Optional service filter (e.g., "ec2", "s3")
+            pattern: Case-insensitive resource type glob, narrowing any included types
             
         Returns:
-            List of resource types to discover
+            Resource types that will be discovered
         """
-        # Start with all resource types
-        filtered_types = self._resource_types.copy()
-        
-        # Apply service filter
-        if service_filter:
-            service_filter = service_filter.lower()
-            filtered_types = [
-                rt for rt in filtered_types 
-                if service_filter in rt.lower()
-            ]
-        
-        # Apply exclusions
-        if self._excluded_types:
-            filtered_types = [
-                rt for rt in filtered_types 
-                if rt not in self._excluded_types
-            ]
-        
-        logger.info(f"Filtered to {len(filtered_types)} resource types for discovery")
-        if service_filter:
-            logger.info(f"Service filter: {service_filter}")
-        if self._excluded_types:
-            logger.info(f"Excluded types: {sorted(self._excluded_types)}")
-        
-        return filtered_types
+        self._ensure_loaded()
+        matched_types = self._match_type_pattern(pattern)
+        if self._included_types is not None:
+            matched_types = [rt for rt in matched_types if rt in self._included_types]
+        
+        self._included_types = frozenset(matched_types)
+        logger.info(f"Filter {pattern} matches {len(matched_types)} resource types")
+        return matched_types
+    
+    def filter_resource_types(self, resource_types: List[str]) -> List[str]:
+        """
+        Apply the included and excluded type lists to a service's resource types
+        
+        Args:
+            resource_types: Resource types supported by a service
+            
+        Returns:
+            Resource types that should be discovered, in input order
+        """
+        included_types = self._included_types
+        excluded_types = self._excluded_types
+        if included_types is None and not excluded_types:
+            return list(resource_types)
+        
+        return [
+            rt for rt in resource_types
+            if (included_types is None or rt in included_types) and rt not in excluded_types
+        ]
+    
+    def _match_type_pattern(self, pattern: str) -> List[str]:
+        """Match resource types against a case-insensitive glob such as AWS::EC2::*"""
+        matcher = type_pattern_matcher(pattern)
+        
+        # A literal service part only needs that service's types, not the full list
+        parts = pattern.split("::")
+        if len(parts) >= 3 and not any(ch in parts[1] for ch in '*?['):
+            candidates = self._types_by_service.get(parts[1].lower(), [])
+        else:
+            candidates = self._resource_types
+        
+        return [rt for rt in candidates if matcher.match(rt)]
     
     def is_loaded(self) -> bool:
         """Check if configuration was successfully loaded"""
+        self._ensure_loaded()
         return self._loaded
     
     def get_config_path(self) -> Path:
@@ -140,7 +216,7 @@ class ResourceTypeConfig:
     def reload(self):
         """Reload configuration from file"""
         self._loaded = False
-        self._load_configuration()
+        self._ensure_loaded()
 
 
 # Global instance for easy access
@@ -156,15 +232,49 @@ def get_resource_config() -> ResourceTypeConfig:
 
 
 def initialize_resource_config(config_path: Optional[str] = None, 
-                             excluded_types: Optional[List[str]] = None):
+                             excluded_types: Optional[List[str]] = None,
+                             included_types: Optional[List[str]] = None,
+                             type_pattern: Optional[str] = None) -> List[str]:
     """
     Initialize the global resource configuration
     
     Args:
         config_path: Path to configuration file
         excluded_types: List of resource types to exclude
+        included_types: Explicit list of resource types to discover
+        type_pattern: Resource type pattern (e.g., "AWS::EC2::*") further restricting discovery
+        
+    Returns:
+        Included resource types that are not in the configuration
     """
     global _global_config
     _global_config = ResourceTypeConfig(config_path)
     if excluded_types:
-        _global_config.set_excluded_types(excluded_types)
\ No newline at end of file
+        _global_config.set_excluded_types(excluded_types)
+    unknown_types = _global_config.set_included_types(included_types)
+    if type_pattern:
+        _global_config.set_type_pattern(type_pattern)
+    return unknown_types
+
+
+def load_resource_types_file(path: str) -> List[str]:
+    """
+    Read resource types from a newline-delimited file
+    
+    Blank lines and lines starting with '#' are ignored; duplicates are dropped.
+    
+    Args:
+        path: Path to the resource types file
+        
+    Returns:
+        Resource types in file order
+    """
+    resource_types = []
+    seen = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            resource_type = line.strip()
+            if resource_type and not resource_type.startswith('#') and resource_type not in seen:
+                seen.add(resource_type)
+                resource_types.append(resource_type)
+    return resource_types
\ No newline at end of file
@@ -2,11 +2,30 @@
 Resource information data model for AWS resource discovery.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
 
 
-@dataclass
+# __slots__ drops the per-instance __dict__; dataclass(slots=True) needs Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=2048)
+def service_from_resource_type(resource_type: str) -> str:
+    """Extract the lowercase service name from a resource type (AWS::EC2::Instance -> ec2)"""
+    parts = resource_type.split("::")
+    return parts[1].lower() if len(parts) > 1 else ""
+
+
+@lru_cache(maxsize=2048)
+def type_name_from_resource_type(resource_type: str) -> str:
+    """Extract the final type segment from a resource type (AWS::EC2::Instance -> Instance)"""
+    return resource_type.rpartition("::")[2]
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ResourceInfo:
     """Data class to hold comprehensive resource information for discovered AWS resources"""
     resource_type: str  # AWS resource type (e.g., "AWS::EC2::Instance")
@@ -24,7 +43,7 @@ class ResourceInfo:
         
         # Extract service name from resource type (AWS::EC2::Instance -> ec2)
         if "::" in self.resource_type:
-            self.service = self.resource_type.split("::")[1].lower()
+            self.service = service_from_resource_type(self.resource_type)
     
     def has_error(self) -> bool:
         """Check if resource discovery encountered an error"""
@@ -0,0 +1,148 @@
+"""
+Persistent cache of resource types Cloud Control cannot list in a region.
+
+Types that fail with UnsupportedActionException or TypeNotFoundException are
+remembered per partition and region so later runs skip the round trip.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+import logging
+
+from utils import json_utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "aws_discovery" / "unsupported.json"
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Error codes that mean the type can never be listed in the region
+UNSUPPORTED_ERROR_CODES = frozenset({'UnsupportedActionException', 'TypeNotFoundException'})
+
+
+def get_partition(region: str) -> str:
+    """Get the AWS partition for a region"""
+    if region.startswith('cn-'):
+        return 'aws-cn'
+    if region.startswith('us-gov-'):
+        return 'aws-us-gov'
+    return 'aws'
+
+
+class UnsupportedTypeCache:
+    """Tracks resource types that are unsupported per partition and region"""
+    
+    def __init__(self, cache_path: Optional[Path] = None, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 enabled: bool = True):
+        """
+        Initialize the cache
+        
+        Args:
+            cache_path: Path to the JSON cache file. If None, uses ~/.cache/aws_discovery/unsupported.json
+            ttl_seconds: Age after which an entry is probed again
+            enabled: When False, nothing is read, recorded or saved
+        """
+        self._cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self._ttl_seconds = ttl_seconds
+        self._enabled = enabled
+        self._entries = {}
+        self._dirty = False
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(region: str, resource_type: str) -> str:
+        return f"{get_partition(region)}|{region}|{resource_type}"
+    
+    def _ensure_loaded(self):
+        """Load cached entries on first access, dropping expired ones"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        if not self._cache_path.exists():
+            return
+        
+        try:
+            entries = json_utils.loads(self._cache_path.read_bytes())
+            
+            cutoff = time.time() - self._ttl_seconds
+            self._entries = {key: ts for key, ts in entries.items() if ts >= cutoff}
+            self._dirty = len(self._entries) != len(entries)
+            logger.info(f"Loaded {len(self._entries)} unsupported resource type entries from {self._cache_path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable type cache {self._cache_path}: {e}")
+            self._entries = {}
+    
+    def is_unsupported(self, region: str, resource_type: str) -> bool:
+        """Check if a resource type is known to be unsupported in a region"""
+        if not self._enabled:
+            return False
+        
+        with self._lock:
+            self._ensure_loaded()
+            ts = self._entries.get(self._key(region, resource_type))
+        return ts is not None and ts >= time.time() - self._ttl_seconds
+    
+    def mark_unsupported(self, region: str, resource_type: str):
+        """Record a resource type as unsupported in a region"""
+        if not self._enabled:
+            return
+        
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[self._key(region, resource_type)] = time.time()
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache atomically if it changed"""
+        if not self._enabled:
+            return
+        
+        with self._lock:
+            if not self._dirty:
+                return
+            
+            try:
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self._cache_path.parent, suffix='.tmp')
+                os.close(fd)
+                try:
+                    json_utils.dump_to_file(self._entries, tmp_path, indent=False)
+                    os.replace(tmp_path, self._cache_path)
+                except Exception:
+                    os.unlink(tmp_path)
+                    raise
+                
+                self._dirty = False
+                logger.debug(f"Saved {len(self._entries)} unsupported resource type entries to {self._cache_path}")
+            except Exception as e:
+                logger.warning(f"Failed to save type cache {self._cache_path}: {e}")
+
+
+# Global instance for easy access
+_global_cache = None
+
+
+def get_unsupported_type_cache() -> UnsupportedTypeCache:
+    """Get the global unsupported type cache instance"""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = UnsupportedTypeCache()
+    return _global_cache
+
+
+def initialize_unsupported_type_cache(enabled: bool = True, cache_path: Optional[str] = None):
+    """
+    Initialize the global unsupported type cache
+    
+    Args:
+        enabled: Whether cached entries are used and new ones recorded
+        cache_path: Path to the cache file
+    """
+    global _global_cache
+    _global_cache = UnsupportedTypeCache(cache_path, enabled=enabled)
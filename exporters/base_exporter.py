@@ -3,12 +3,13 @@ Base exporter class for AWS resource discovery output formats.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
 
 from core.resource_info import ResourceInfo
 from core.config import DiscoveryConfig
+from core.resource_config import is_type_pattern, type_pattern_matcher
 
 
 class BaseExporter(ABC):
@@ -54,14 +55,23 @@ class BaseExporter(ABC):
         """Filter resources based on configuration"""
         filtered = []
         
+        # Resource type patterns (e.g., AWS::EC2::*) match the type, other filters the service
+        service_filter = self.config.service_filter
+        type_matcher = type_pattern_matcher(service_filter) if is_type_pattern(service_filter) else None
+        if service_filter:
+            service_filter = service_filter.lower()
+        
         for resource in resources:
             # Skip resources with errors if configured
             if resource.has_error():
                 continue
             
             # Apply service filter if configured
-            if self.config.service_filter:
-                if self.config.service_filter.lower() not in resource.service.lower():
+            if type_matcher is not None:
+                if not type_matcher.match(resource.resource_type):
+                    continue
+            elif service_filter:
+                if service_filter not in resource.service.lower():
                     continue
             
             filtered.append(resource)
@@ -83,21 +93,23 @@ class BaseExporter(ABC):
     def get_export_statistics(self, resources: List[ResourceInfo]) -> Dict[str, Any]:
         """Get statistics about the exported resources"""
         total_resources = len(resources)
-        resources_with_errors = sum(1 for r in resources if r.has_error())
-        valid_resources = total_resources - resources_with_errors
-        
-        # Count by service
+        resources_with_errors = 0
         service_counts = {}
+        region_counts = {}
+        
+        # Count errors, services and regions in a single pass
         for resource in resources:
+            if resource.has_error():
+                resources_with_errors += 1
+            
             service = resource.service or 'unknown'
             service_counts[service] = service_counts.get(service, 0) + 1
-        
-        # Count by region
-        region_counts = {}
-        for resource in resources:
+            
             region = resource.region or 'global'
             region_counts[region] = region_counts.get(region, 0) + 1
         
+        valid_resources = total_resources - resources_with_errors
+        
         return {
             'total_resources': total_resources,
             'valid_resources': valid_resources,
@@ -106,9 +118,11 @@ class BaseExporter(ABC):
             'regions': region_counts
         }
     
-    def log_export_summary(self, resources: List[ResourceInfo], output_path: Path):
-        """Log export summary"""
-        stats = self.get_export_statistics(resources)
+    def log_export_summary(self, resources: List[ResourceInfo], output_path: Path,
+                           stats: Optional[Dict[str, Any]] = None):
+        """Log export summary, reusing already computed statistics when given"""
+        if stats is None:
+            stats = self.get_export_statistics(resources)
         
         self.logger.info(f"📄 {self.get_format_name().upper()} Export Summary:")
         self.logger.info(f"   File: {output_path}")
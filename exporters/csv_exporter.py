@@ -0,0 +1,71 @@
+"""
+CSV exporter for AWS resource discovery.
+"""
+
+import csv
+from typing import List
+from pathlib import Path
+
+from core.resource_info import ResourceInfo
+from utils import json_utils
+from .base_exporter import BaseExporter
+
+
+# Write through a large buffer so rows are flushed in big chunks
+CSV_BUFFER_SIZE = 1 << 20
+
+CSV_FIELDNAMES = ['resource_type', 'service', 'identifier', 'arn', 'region', 'properties', 'error']
+
+
+class CSVExporter(BaseExporter):
+    """Export resources to CSV format, streaming one row per resource"""
+    
+    def get_format_name(self) -> str:
+        return "csv"
+    
+    def get_file_extension(self) -> str:
+        return ".csv"
+    
+    def _resource_row(self, resource: ResourceInfo) -> tuple:
+        """Build a CSV row in CSV_FIELDNAMES order without an intermediate dict"""
+        return (
+            resource.resource_type,
+            resource.service,
+            resource.identifier,
+            resource.arn,
+            resource.region,
+            json_utils.dumps(resource.properties),
+            resource.error
+        )
+    
+    def export_resources(self, resources: List[ResourceInfo], filename: str = None) -> Path:
+        """Export resources to CSV file"""
+        if not self.should_export():
+            self.logger.debug("CSV export disabled by configuration")
+            return None
+        
+        if filename is None:
+            filename = self.get_output_filename()
+        
+        output_path = self.get_output_path(filename)
+        
+        self.logger.info(f"📄 Exporting {len(resources)} resources to CSV: {output_path}")
+        
+        # Filter resources
+        filtered_resources = self.filter_resources(resources)
+        
+        # Write CSV file row by row instead of building the whole table in memory
+        try:
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDNAMES)
+                
+                # writerows consumes the generator in C, one Python call for all rows
+                writer.writerows(self._resource_row(resource) for resource in filtered_resources)
+            
+            self.log_export_summary(filtered_resources, output_path)
+            return output_path
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export CSV: {e}")
+            raise
@@ -0,0 +1,88 @@
+"""
+Excel exporter for AWS resource discovery.
+"""
+
+from typing import List
+from pathlib import Path
+
+from core.resource_info import ResourceInfo
+from utils import json_utils
+from .base_exporter import BaseExporter
+
+
+# Excel rejects cells longer than this many characters
+EXCEL_MAX_CELL_LENGTH = 32767
+
+EXCEL_FIELDNAMES = ['resource_type', 'service', 'identifier', 'arn', 'region', 'properties', 'error']
+
+
+class ExcelExporter(BaseExporter):
+    """Export resources to Excel format"""
+    
+    def get_format_name(self) -> str:
+        return "excel"
+    
+    def get_file_extension(self) -> str:
+        return ".xlsx"
+    
+    def _resource_row(self, resource: ResourceInfo) -> list:
+        """Build a sheet row in EXCEL_FIELDNAMES order"""
+        return [
+            resource.resource_type,
+            resource.service,
+            resource.identifier,
+            resource.arn,
+            resource.region,
+            json_utils.dumps(resource.properties)[:EXCEL_MAX_CELL_LENGTH],
+            resource.error
+        ]
+    
+    def export_resources(self, resources: List[ResourceInfo], filename: str = None) -> Path:
+        """Export resources to Excel workbook"""
+        if not self.should_export():
+            self.logger.debug("Excel export disabled by configuration")
+            return None
+        
+        # openpyxl is only needed for Excel, so it is imported on demand
+        try:
+            from openpyxl import Workbook
+        except ImportError as e:
+            raise ImportError(
+                "Excel export requires openpyxl (pip install openpyxl)"
+            ) from e
+        
+        if filename is None:
+            filename = self.get_output_filename()
+        
+        output_path = self.get_output_path(filename)
+        
+        self.logger.info(f"📄 Exporting {len(resources)} resources to Excel: {output_path}")
+        
+        # Filter resources
+        filtered_resources = self.filter_resources(resources)
+        
+        stats = self.get_export_statistics(filtered_resources)
+        
+        # Write Excel file in write-only mode, which streams rows out instead of
+        # keeping every cell object in memory
+        try:
+            workbook = Workbook(write_only=True)
+            
+            resources_sheet = workbook.create_sheet('All Resources')
+            resources_sheet.append(EXCEL_FIELDNAMES)
+            for resource in filtered_resources:
+                resources_sheet.append(self._resource_row(resource))
+            
+            summary_sheet = workbook.create_sheet('Summary')
+            summary_sheet.append(['service', 'resources'])
+            for service, count in sorted(stats['services'].items(), key=lambda x: x[1], reverse=True):
+                summary_sheet.append([service, count])
+            
+            workbook.save(output_path)
+            
+            self.log_export_summary(filtered_resources, output_path, stats)
+            return output_path
+            
+        except Exception as e:
+            self.logger.error(f"Failed to export Excel: {e}")
+            raise
@@ -0,0 +1,120 @@
+"""
+HTML report exporter for AWS resource discovery.
+"""
+
+from html import escape
+from typing import List
+from pathlib import Path
+from datetime import datetime
+
+from core.resource_info import ResourceInfo
+from utils import json_utils
+from .base_exporter import BaseExporter
+
+
+# Write through a large buffer so table rows are flushed in big chunks
+HTML_BUFFER_SIZE = 1 << 20
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>AWS Resource Discovery - {region}</title>
+<style>
+body {{ font-family: -apple-system, Segoe UI, Helvetica, Arial, sans-serif; margin: 2em; color: #232f3e; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #d5dbdb; padding: 4px 8px; text-align: left; vertical-align: top; font-size: 13px; }}
+th {{ background: #232f3e; color: #fff; }}
+tr.error td {{ background: #fdecea; }}
+pre {{ margin: 0; white-space: pre-wrap; word-break: break-all; }}
+</style>
+</head>
+<body>
+<h1>AWS Resource Discovery</h1>
+<p>Region: {region} &middot; Generated: {timestamp} &middot; Resources: {total} ({valid} valid, {errors} with errors)</p>
+"""
+
+HTML_ROW = (
+    "<tr{row_class}><td>{resource_type}</td><td>{service}</td><td>{identifier}</td>"
+    "<td>{arn}</td><td>{region}</td>"
+    "<td><details><summary>show</summary><pre>{properties}</pre></details></td>"
+    "<td>{error}</td></tr>\n"
+)
+
+HTML_TAIL = """</tbody>
+</table>
+</body>
+</html>
+"""
+
+
+class HTMLExporter(BaseExporter):
+    """Export resources to an HTML report, streaming one table row per resource"""
+    
+    def get_format_name(self) -> str:
+        return "html"
+    
+    def get_file_extension(self) -> str:
+        return ".html"
+    
+    def _resource_row(self, resource: ResourceInfo) -> str:
+        """Render the table row for a resource"""
+        return HTML_ROW.format(
+            row_class=' class="error"' if resource.has_error() else '',
+            resource_type=escape(resource.resource_type),
+            service=escape(resource.service or ''),
+            identifier=escape(resource.identifier or ''),
+            arn=escape(resource.arn or ''),
+            region=escape(resource.region or ''),
+            properties=escape(json_utils.dumps(resource.properties)) if resource.properties else '',
+            error=escape(resource.error or '')
+        )
+    
+    def export_resources(self, resources: List[ResourceInfo], filename: str = None) -> Path:
+        """Export resources to an HTML report"""
+        if not self.should_export():
+            self.logger.debug("HTML export disabled by configuration")
+            return None
+        
+        if filename is None:
+            filename = self.get_output_filename()
+        
+        output_path = self.get_output_path(filename)
+        
+        self.logger.info(f"📄 Exporting {len(resources)} resources to HTML: {output_path}")
+        
+        # Filter resources
+        filtered_resources = self.filter_resources(resources)
+        
+        stats = self.get_export_statistics(filtered_resources)
+        
+        # Write the report piece by piece instead of building one large string
+        try:
+            with open(output_path, 'w', encoding='utf-8', buffering=HTML_BUFFER_SIZE) as f:
+                f.write(HTML_HEAD.format(
+                    region=escape(self.config.region),
+                    timestamp=datetime.now().isoformat(timespec='seconds'),
+                    total=stats['total_resources'],
+                    valid=stats['valid_resources'],
+                    errors=stats['resources_with_errors']
+                ))
+                
+                f.write("<h2>Resources by Service</h2>\n<table>\n<thead><tr><th>Service</th><th>Resources</th></tr></thead>\n<tbody>\n")
+                for service, count in sorted(stats['services'].items(), key=lambda x: x[1], reverse=True):
+                    f.write(f"<tr><td>{escape(service)}</td><td>{count}</td></tr>\n")
+                f.write("</tbody>\n</table>\n")
+                
+                f.write(
+                    "<h2>Resources</h2>\n<table>\n<thead><tr><th>Type</th><th>Service</th><th>Identifier</th>"
+                    "<th>ARN</th><th>Region</th><th>Properties</th><th>Error</th></tr></thead>\n<tbody>\n"
+                )
+                f.writelines(self._resource_row(resource) for resource in filtered_resources)
+                
+                f.write(HTML_TAIL)
+            
+            self.log_export_summary(filtered_resources, output_path, stats)
+            return output_path
+        
+        except Exception as e:
+            self.logger.error(f"Failed to export HTML: {e}")
+            raise
@@ -2,15 +2,21 @@
 JSON exporter for AWS resource discovery.
 """
 
-import json
-from typing import List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
 
-from core.resource_info import ResourceInfo
+from core.resource_info import ResourceInfo, type_name_from_resource_type
+from utils import json_utils
 from .base_exporter import BaseExporter
 
 
+# Characters that are not allowed in filenames on common filesystems, mapped to '_'
+_UNSAFE_FILENAME_CHARS = str.maketrans('/\\:<>|*?"', '_' * 9)
+
+
 class JSONExporter(BaseExporter):
     """Export resources to JSON format"""
     
@@ -28,6 +34,8 @@ class JSONExporter(BaseExporter):
         
         if filename is None:
             filename = self.get_output_filename()
+            if self.config.compress_output:
+                filename += ".gz"
         
         output_path = self.get_output_path(filename)
         
@@ -36,6 +44,8 @@ class JSONExporter(BaseExporter):
         # Filter resources
         filtered_resources = self.filter_resources(resources)
         
+        stats = self.get_export_statistics(filtered_resources)
+        
         # Prepare export data
         export_data = {
             'metadata': {
@@ -46,21 +56,16 @@ class JSONExporter(BaseExporter):
                 'total_resources': len(resources),
                 'filtered_resources': len(filtered_resources)
             },
-            'statistics': self.get_export_statistics(filtered_resources),
-            'resources': []
+            'statistics': stats,
+            # prepare_resource_data passes properties through by reference, no copies
+            'resources': [self.prepare_resource_data(resource) for resource in filtered_resources]
         }
         
-        # Add resource data
-        for resource in filtered_resources:
-            resource_data = self.prepare_resource_data(resource)
-            export_data['resources'].append(resource_data)
-        
         # Write JSON file
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, default=str, ensure_ascii=False)
+            json_utils.dump_to_file(export_data, output_path, compress=self.config.compress_output)
             
-            self.log_export_summary(filtered_resources, output_path)
+            self.log_export_summary(filtered_resources, output_path, stats)
             return output_path
             
         except Exception as e:
@@ -77,47 +82,55 @@ class JSONExporter(BaseExporter):
         
         self.logger.info(f"📁 Creating individual JSON descriptions in: {descriptions_dir}")
         
-        exported_files = []
-        filtered_resources = self.filter_resources(resources)
+        filtered_resources = [r for r in self.filter_resources(resources) if r.is_valid()]
         
-        for resource in filtered_resources:
-            if not resource.is_valid():
-                continue
-            
-            # Create safe filename
-            safe_identifier = self._make_safe_filename(resource.identifier)
-            filename = f"{resource.service}_{resource.resource_type.split('::')[-1]}_{safe_identifier}.json"
-            file_path = descriptions_dir / filename
-            
-            try:
-                resource_data = {
-                    'metadata': {
-                        'export_format': 'json_individual',
-                        'timestamp': datetime.now().isoformat(),
-                        'resource_type': resource.resource_type,
-                        'service': resource.service,
-                        'region': resource.region
-                    },
-                    'resource': self.prepare_resource_data(resource)
-                }
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(resource_data, f, indent=2, default=str, ensure_ascii=False)
-                
-                exported_files.append(file_path)
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to export individual description for {resource.identifier}: {e}")
+        # Each file is an independent write, so spread them over description_workers threads
+        workers = min(self.config.description_workers, len(filtered_resources))
+        if workers <= 1:
+            results = [self._write_individual_description(r, descriptions_dir) for r in filtered_resources]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda r: self._write_individual_description(r, descriptions_dir),
+                    filtered_resources
+                ))
+        
+        exported_files = [file_path for file_path in results if file_path is not None]
         
         self.logger.info(f"✓ Created {len(exported_files)} individual JSON descriptions")
         return exported_files
     
+    def _write_individual_description(self, resource: ResourceInfo, descriptions_dir: Path) -> Optional[Path]:
+        """Write one resource description file, returning its path or None on failure"""
+        # Create safe filename
+        safe_identifier = self._make_safe_filename(resource.identifier)
+        filename = f"{resource.service}_{type_name_from_resource_type(resource.resource_type)}_{safe_identifier}.json"
+        file_path = descriptions_dir / filename
+        
+        try:
+            resource_data = {
+                'metadata': {
+                    'export_format': 'json_individual',
+                    'timestamp': datetime.now().isoformat(),
+                    'resource_type': resource.resource_type,
+                    'service': resource.service,
+                    'region': resource.region
+                },
+                'resource': self.prepare_resource_data(resource)
+            }
+            
+            json_utils.dump_to_file(resource_data, file_path)
+            
+            return file_path
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to export individual description for {resource.identifier}: {e}")
+            return None
+    
     def _make_safe_filename(self, identifier: str) -> str:
         """Make a safe filename from resource identifier"""
-        # Replace unsafe characters
-        safe = identifier.replace('/', '_').replace('\\', '_').replace(':', '_')
-        safe = safe.replace('<', '_').replace('>', '_').replace('|', '_')
-        safe = safe.replace('*', '_').replace('?', '_').replace('"', '_')
+        # Replace unsafe characters in a single pass
+        safe = identifier.translate(_UNSAFE_FILENAME_CHARS)
         
         # Limit length
         if len(safe) > 100:
@@ -145,20 +158,24 @@ class JSONExporter(BaseExporter):
             'services': {}
         }
         
-        # Group by resource type
+        # Group by resource type, recording each new type under its service in the same pass
+        type_summaries = summary_data['resource_types']
+        types_by_service = defaultdict(list)
         for resource in filtered_resources:
             rt = resource.resource_type
-            if rt not in summary_data['resource_types']:
-                summary_data['resource_types'][rt] = {
+            type_summary = type_summaries.get(rt)
+            if type_summary is None:
+                type_summary = type_summaries[rt] = {
                     'count': 0,
                     'service': resource.service,
                     'sample_resources': []
                 }
+                types_by_service[resource.service].append(rt)
             
-            summary_data['resource_types'][rt]['count'] += 1
+            type_summary['count'] += 1
             
             # Add sample resource (limit to 3 samples per type)
-            samples = summary_data['resource_types'][rt]['sample_resources']
+            samples = type_summary['sample_resources']
             if len(samples) < 3:
                 samples.append({
                     'identifier': resource.identifier,
@@ -168,8 +185,7 @@ class JSONExporter(BaseExporter):
         
         # Group by service
         for service, count in stats['services'].items():
-            resource_types = [rt for rt, data in summary_data['resource_types'].items() 
-                            if data['service'] == service]
+            resource_types = types_by_service.get(service, [])
             
             summary_data['services'][service] = {
                 'total_resources': count,
@@ -178,8 +194,7 @@ class JSONExporter(BaseExporter):
             }
         
         try:
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, default=str, ensure_ascii=False)
+            json_utils.dump_to_file(summary_data, summary_path)
             
             self.logger.info(f"📊 Created JSON summary: {summary_path}")
             return summary_path
@@ -0,0 +1,61 @@
+"""
+JSON Lines exporter for AWS resource discovery.
+"""
+
+import gzip
+from typing import List
+from pathlib import Path
+
+from core.resource_info import ResourceInfo
+from utils import json_utils
+from .base_exporter import BaseExporter
+
+
+# Write through a large buffer so lines are flushed in big chunks
+JSONL_BUFFER_SIZE = 1 << 20
+
+
+class JSONLExporter(BaseExporter):
+    """Export resources as JSON Lines, one resource object per line"""
+    
+    def get_format_name(self) -> str:
+        return "jsonl"
+    
+    def get_file_extension(self) -> str:
+        return ".jsonl"
+    
+    def export_resources(self, resources: List[ResourceInfo], filename: str = None) -> Path:
+        """Export resources to a JSON Lines file"""
+        if not self.should_export():
+            self.logger.debug("JSONL export disabled by configuration")
+            return None
+        
+        if filename is None:
+            filename = self.get_output_filename()
+            if self.config.compress_output:
+                filename += ".gz"
+        
+        output_path = self.get_output_path(filename)
+        
+        self.logger.info(f"📄 Exporting {len(resources)} resources to JSONL: {output_path}")
+        
+        # Filter resources
+        filtered_resources = self.filter_resources(resources)
+        
+        # Serialize one resource at a time so the whole document is never held in memory
+        try:
+            if self.config.compress_output:
+                f = gzip.open(output_path, 'wt', compresslevel=json_utils.GZIP_COMPRESS_LEVEL, encoding='utf-8')
+            else:
+                f = open(output_path, 'w', encoding='utf-8', buffering=JSONL_BUFFER_SIZE)
+            with f:
+                for resource in filtered_resources:
+                    f.write(json_utils.dumps(self.prepare_resource_data(resource)))
+                    f.write('\n')
+            
+            self.log_export_summary(filtered_resources, output_path)
+            return output_path
+        
+        except Exception as e:
+            self.logger.error(f"Failed to export JSONL: {e}")
+            raise
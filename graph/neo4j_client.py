@@ -3,28 +3,321 @@ Neo4j client for managing graph database connections and operations.
 """
 
 import logging
+import re
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict, Counter
-import json
 
-from neo4j import GraphDatabase
+from neo4j import GraphDatabase, RoutingControl
 from neo4j.exceptions import Neo4jError, ServiceUnavailable, AuthError
 
+from core.base_service import GLOBAL_SERVICES
 from core.config import DiscoveryConfig
 from core.resource_info import ResourceInfo
+from utils import json_utils
+
+
+# Number of rows sent per UNWIND statement when writing resource nodes
+NODE_BATCH_SIZE = 1000
+
+# Fail fast when no pooled connection frees up or a write keeps hitting
+# transient errors, instead of stalling the ingest on a single statement
+CONNECTION_ACQUISITION_TIMEOUT = 30
+MAX_TRANSACTION_RETRY_TIME = 15
+
+# Property keys whose values name or reference an IAM role
+ROLE_REFERENCE_FIELDS = frozenset({'RoleName', 'RoleArn', 'IamInstanceProfile'})
+
+# Route properties that point at another resource, and the type of that resource
+ROUTE_TARGET_TYPES = {
+    'gateway_id': 'AWS::EC2::InternetGateway',
+    'nat_gateway_id': 'AWS::EC2::NatGateway',
+    'instance_id': 'AWS::EC2::Instance',
+    'network_interface_id': 'AWS::EC2::NetworkInterface',
+    'transit_gateway_id': 'AWS::EC2::TransitGateway',
+    'vpc_peering_connection_id': 'AWS::EC2::VPCPeeringConnection'
+}
+
+# Route fields copied onto RouteRule nodes, by their key in describe_route_tables
+ROUTE_FIELDS = {
+    'DestinationCidrBlock': 'destination_cidr_block',
+    'DestinationIpv6CidrBlock': 'destination_ipv6_cidr_block',
+    'DestinationPrefixListId': 'destination_prefix_list_id',
+    'GatewayId': 'gateway_id',
+    'InstanceId': 'instance_id',
+    'InstanceOwnerId': 'instance_owner_id',
+    'NetworkInterfaceId': 'network_interface_id',
+    'TransitGatewayId': 'transit_gateway_id',
+    'VpcPeeringConnectionId': 'vpc_peering_connection_id',
+    'NatGatewayId': 'nat_gateway_id',
+    'CarrierGatewayId': 'carrier_gateway_id',
+    'LocalGatewayId': 'local_gateway_id',
+    'CoreNetworkArn': 'core_network_arn',
+    'State': 'state',
+    'Origin': 'origin'
+}
+
+# Labels of the sub-component nodes written by the enhanced component helpers,
+# all merged on arn
+COMPONENT_LABELS = (
+    'RouteRule', 'RDSClusterMember', 'RDSParameterGroup',
+    'ElastiCacheNode', 'MQBrokerInstance', 'ApiGatewayStage'
+)
+
+# Levels of nested property dicts flattened into prefixed node properties
+# (VpcConfig_VpcId); anything deeper is stored as one JSON string property
+FLATTEN_MAX_DEPTH = 3
+
+# Resource ids per EC2 describe filter; EC2 accepts up to 200 filter values
+DESCRIBE_FILTER_BATCH_SIZE = 100
+
+# Characters that cannot appear in an unquoted Cypher label
+_INVALID_LABEL_CHARS = re.compile(r'[^A-Za-z0-9_]')
+
+
+@lru_cache(maxsize=None)
+def _node_type_for(resource_type: str) -> str:
+    """Map an AWS resource type to its node label, computed once per type"""
+    if not resource_type.startswith('AWS::'):
+        return 'UnknownResource'
+    
+    parts = resource_type.split('::')
+    if len(parts) >= 3:
+        return _INVALID_LABEL_CHARS.sub('_', parts[2])
+    
+    return 'UnknownResource'
+
+
+def _clean_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop missing (None or empty string) values, keeping meaningful False and 0 values"""
+    return {k: v for k, v in properties.items() if v is not None and v != ''}
+
+
+@lru_cache(maxsize=100_000)
+def _role_name_from_reference(value: str) -> str:
+    """Extract the role name from a role ARN or name, cached since the same roles are referenced repeatedly"""
+    # arn:aws:iam::123456789012:role/path/MyRole -> MyRole
+    return value.rpartition('/')[2]
+
+
+@lru_cache(maxsize=100_000)
+def _usage_relationship_type(target_type: str, path: str, key: str) -> str:
+    """Classify a property reference, cached since the same keys and paths recur across resources"""
+    key_lower = key.lower()
+    path_lower = path.lower()
+    
+    # Logging relationships
+    if 'log' in key_lower or 'logging' in path_lower:
+        return 'LOGS_TO'
+    
+    # Network relationships
+    if 'vpc' in key_lower and 'VPC' in target_type:
+        return 'DEPLOYED_IN'
+    if 'subnet' in key_lower and 'Subnet' in target_type:
+        return 'DEPLOYED_IN'
+    if 'securitygroup' in key_lower or 'groupid' in key_lower:
+        return 'PROTECTED_BY'
+    
+    # IAM relationships
+    if 'role' in key_lower and 'Role' in target_type:
+        return 'ASSUMES'
+    if 'policy' in key_lower and 'Policy' in target_type:
+        return 'HAS_POLICY'
+    
+    # Storage relationships
+    if 'volume' in key_lower and 'Volume' in target_type:
+        return 'USES_VOLUME'
+    if 'snapshot' in key_lower and 'Snapshot' in target_type:
+        return 'CREATED_FROM'
+    
+    # Network routing
+    if 'route' in key_lower or 'gateway' in key_lower:
+        return 'ROUTES_THROUGH'
+    
+    # Load balancer relationships
+    if 'loadbalancer' in key_lower or 'targetgroup' in key_lower:
+        return 'LOAD_BALANCED_BY'
+    
+    # Database relationships
+    if 'db' in key_lower and any(db in target_type for db in ['DB', 'Database', 'RDS']):
+        return 'CONNECTS_TO'
+    
+    # Default fallback
+    return 'USES'
+
+
+@lru_cache(maxsize=None)
+def _merge_nodes_query(label: str, unique_key: str) -> str:
+    """Build the UNWIND MERGE statement for a label once, so the text is identical for every batch"""
+    return f"""
+        UNWIND $rows AS row
+        MERGE (r:{label} {{{unique_key}: row.unique_value}})
+        SET r += row.props
+        RETURN count(r) AS merged
+        """
+
+
+@lru_cache(maxsize=None)
+def _account_owns_query(label: str, unique_key: str) -> str:
+    """Build the account OWNS statement for a label once"""
+    return f"""
+        MATCH (a:Account {{id: $account_id}})
+        UNWIND $unique_values AS unique_value
+        MATCH (r:{label} {{{unique_key}: unique_value}})
+        MERGE (a)-[:OWNS]->(r)
+        """
+
+
+@lru_cache(maxsize=None)
+def _usage_relationship_query(source_label: str, target_label: str, rel_type: str) -> str:
+    """Build the UNWIND statement for usage relationships of one label pair and type"""
+    return f"""
+        UNWIND $rows AS row
+        MATCH (source:{source_label} {{arn: row.source_arn}})
+        MATCH (target:{target_label} {{arn: row.target_arn}})
+        MERGE (source)-[r:{rel_type}]->(target)
+        SET r.created_at = datetime()
+        RETURN count(r) AS created
+        """
+
+
+@lru_cache(maxsize=None)
+def _routes_to_query(target_label: str) -> str:
+    """Build the UNWIND statement linking route rules to targets of one label"""
+    return f"""
+        UNWIND $rows AS row
+        MATCH (rr:RouteRule {{arn: row.route_arn}})
+        MATCH (target:{target_label} {{arn: row.target_arn}})
+        MERGE (rr)-[:ROUTES_TO]->(target)
+        """
+
+
+# Fixed write statements of the route rule and enhanced component helpers, kept
+# as single module-level strings so every batch sends identical query text
+ROUTE_RULE_QUERY = """
+    OPTIONAL MATCH (account:Account {id: $account_id})
+    UNWIND $rows AS row
+    MERGE (rr:RouteRule {arn: row.arn})
+    SET rr += row.properties
+    FOREACH (_ IN CASE WHEN account IS NULL THEN [] ELSE [1] END | MERGE (account)-[:OWNS]->(rr))
+    WITH rr, row
+    MATCH (rt:RouteTable {arn: row.route_table_arn})
+    MERGE (rt)-[:HAS_ROUTE]->(rr)
+    """
+
+RDS_CLUSTER_MEMBER_QUERY = """
+    UNWIND $rows AS row
+    MERGE (instance:RDSClusterMember {
+        arn: row.instance_arn,
+        instance_id: row.instance_id,
+        is_writer: row.is_writer,
+        promotion_tier: row.promotion_tier,
+        resource_type: 'AWS::RDS::DBClusterMember',
+        service: 'rds',
+        region: $region,
+        account_id: $account_id
+    })
+    WITH instance, row
+    MATCH (account:Account {id: $account_id})
+    MERGE (account)-[:OWNS]->(instance)
+    WITH instance, row
+    MATCH (cluster:DBCluster {arn: row.cluster_arn})
+    MERGE (cluster)-[:HAS_MEMBER]->(instance)
+    """
+
+RDS_PARAMETER_GROUP_QUERY = """
+    UNWIND $rows AS row
+    MERGE (pg:RDSParameterGroup {
+        arn: row.param_group_arn,
+        name: row.param_group,
+        resource_type: 'AWS::RDS::DBClusterParameterGroup',
+        service: 'rds',
+        region: $region,
+        account_id: $account_id
+    })
+    WITH pg, row
+    MATCH (account:Account {id: $account_id})
+    MERGE (account)-[:OWNS]->(pg)
+    WITH pg, row
+    MATCH (cluster:DBCluster {arn: row.cluster_arn})
+    MERGE (cluster)-[:USES_PARAMETER_GROUP]->(pg)
+    """
+
+ELASTICACHE_NODE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (node:ElastiCacheNode {arn: row.arn})
+    SET node += row.properties
+    WITH node, row
+    MATCH (cluster:CacheCluster {arn: row.cluster_arn})
+    MERGE (cluster)-[:HAS_NODE]->(node)
+    """
+
+MQ_BROKER_INSTANCE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (instance:MQBrokerInstance {arn: row.arn})
+    SET instance += row.properties
+    WITH instance, row
+    MATCH (broker:Broker {arn: row.broker_arn})
+    MERGE (broker)-[:HAS_INSTANCE]->(instance)
+    """
+
+APIGATEWAY_STAGE_QUERY = """
+    UNWIND $rows AS row
+    MERGE (stage:ApiGatewayStage {arn: row.arn})
+    SET stage += row.properties
+    WITH stage, row
+    MATCH (api:RestApi {arn: row.api_arn})
+    MERGE (api)-[:HAS_STAGE]->(stage)
+    """
+
+TGW_CROSS_ACCOUNT_QUERY = """
+    UNWIND $rows AS row
+    MERGE (source_account:Account {id: $source_account_id})
+    MERGE (target_account:Account {id: row.target_account_id})
+    MERGE (source_account)-[:CONNECTED_VIA_TRANSIT_GATEWAY {
+        transit_gateway_id: row.tgw_id,
+        attachment_id: row.attachment_id,
+        connection_type: 'Transit Gateway VPC Attachment',
+        vpc_id: row.vpc_id,
+        created_at: datetime()
+    }]->(target_account)
+    """
+
+PCX_CROSS_ACCOUNT_QUERY = """
+    UNWIND $rows AS row
+    MERGE (source_account:Account {id: $source_account_id})
+    MERGE (target_account:Account {id: row.target_account_id})
+    MERGE (source_account)-[:CONNECTED_VIA_VPC_PEERING {
+        peering_connection_id: row.pcx_id,
+        connection_type: 'VPC Peering Connection',
+        accepter_vpc_id: row.accepter_vpc_id,
+        requester_vpc_id: row.requester_vpc_id,
+        status: row.status,
+        created_at: datetime()
+    }]->(target_account)
+    """
 
 
 class Neo4jClient:
     """Neo4j client for AWS resource discovery graph operations"""
     
-    def __init__(self, config: DiscoveryConfig):
-        """Initialize Neo4j client with configuration"""
+    def __init__(self, config: DiscoveryConfig, aws_session=None):
+        """Initialize Neo4j client with configuration and an optional AWS session to share"""
         self.config = config
         self.logger = logging.getLogger('aws_discovery.neo4j')
         self.driver = None
         self._account_id = None
+        self._indexed_labels = set()
         
-        # Connection statistics
+        # AWS session for enhanced component lookups; when discovery's session is
+        # passed in, its already created clients are reused
+        self._aws_session = aws_session
+        self._aws_session_lock = threading.Lock()
+        
+        # Connection statistics (updated from parallel writer threads)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'nodes_created': 0,
             'relationships_created': 0,
@@ -45,11 +338,13 @@ class Neo4jClient:
             
             self.driver = GraphDatabase.driver(
                 uri,
-                auth=(self.config.graph_db_user, self.config.graph_db_password)
+                auth=(self.config.graph_db_user, self.config.graph_db_password),
+                connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT,
+                max_transaction_retry_time=MAX_TRANSACTION_RETRY_TIME
             )
             
             # Test connection
-            with self.driver.session() as session:
+            with self._session() as session:
                 result = session.run("RETURN 1 as test")
                 test_value = result.single()["test"]
                 if test_value == 1:
@@ -67,6 +362,22 @@ class Neo4jClient:
             self.logger.error(f"✗ Failed to connect to Neo4j: {e}")
             raise
     
+    def _session(self):
+        """Open a session on the configured database"""
+        return self.driver.session(database=self.config.graph_db_name)
+    
+    def _execute_write(self, query: str, **parameters):
+        """Run a one-shot write with the driver's managed transaction and retries"""
+        # Writes are routed to the leader, which always sees its own commits, so the
+        # batches don't need to be causally chained through a shared bookmark manager
+        return self.driver.execute_query(
+            query,
+            parameters,
+            database_=self.config.graph_db_name,
+            routing_=RoutingControl.WRITE,
+            bookmark_manager_=None
+        )
+    
     def close(self):
         """Close Neo4j connection"""
         if self.driver:
@@ -79,7 +390,7 @@ class Neo4jClient:
             return False
         
         try:
-            with self.driver.session() as session:
+            with self._session() as session:
                 session.run("RETURN 1").single()
             return True
         except Exception:
@@ -93,7 +404,7 @@ class Neo4jClient:
         self.logger.info("🔄 Resetting Neo4j graph database")
         
         try:
-            with self.driver.session() as session:
+            with self._session() as session:
                 # Delete all nodes and relationships
                 session.run("MATCH (n) DETACH DELETE n")
                 self.logger.info("✓ All nodes and relationships deleted")
@@ -127,6 +438,27 @@ class Neo4jClient:
             except Exception as e:
                 self.logger.debug(f"Constraint/index already exists or failed: {e}")
     
+    def _ensure_label_indexes(self, labels, keys=('arn', 'composite_id')):
+        """Create indexes on the MERGE key properties of the given node labels"""
+        new_labels = sorted(set(labels) - self._indexed_labels)
+        if not new_labels:
+            return
+        
+        self.logger.info(f"Ensuring MERGE key indexes for {len(new_labels)} node labels")
+        
+        with self._session() as session:
+            for label in new_labels:
+                for key in keys:
+                    statement = f"CREATE INDEX {label}_{key}_index IF NOT EXISTS FOR (n:{label}) ON (n.{key})"
+                    try:
+                        session.run(statement)
+                        self.stats['indexes_created'] += 1
+                        self.logger.debug(f"✓ Created index: {statement}")
+                    except Exception as e:
+                        self.logger.debug(f"Index already exists or failed: {e}")
+                
+                self._indexed_labels.add(label)
+    
     def create_account_node(self, account_id: str, account_name: Optional[str] = None):
         """Create or update account node"""
         self._account_id = account_id
@@ -137,7 +469,7 @@ class Neo4jClient:
         self.logger.info(f"📊 Creating account node: {account_name} ({account_id})")
         
         try:
-            with self.driver.session() as session:
+            with self._session() as session:
                 query = """
                 MERGE (a:Account {id: $account_id})
                 SET a.name = $account_name, a.updated_at = datetime()
@@ -160,34 +492,45 @@ class Neo4jClient:
         
         self.logger.info(f"📈 Adding {len(resources)} resources to Neo4j graph")
         
-        # Convert resources to dictionary format for enhanced components
+        # In one pass, de-duplicate resources by ARN (the ResourceInfo objects are
+        # shared, not copied) and group them by node label, then by type
         resources_dict = {}
+        resources_by_label = defaultdict(lambda: defaultdict(list))
         for resource in resources:
-            if not resource.has_error() and resource.is_valid():
-                resources_dict[resource.arn] = {
-                    'resource_type': resource.resource_type,
-                    'identifier': resource.identifier,
-                    'service': resource.service,
-                    'region': resource.region,
-                    'properties': resource.properties or {}
-                }
-        
-        # Group resources by type for efficient processing
+            if resource.has_error() or not resource.is_valid():
+                continue
+            
+            resources_dict[resource.arn] = resource
+            
+            label = self._extract_node_type(resource.resource_type)
+            resources_by_label[label][resource.resource_type].append(resource)
+        
+        # Bucket the de-duplicated resources by type once; the component helpers
+        # read their bucket instead of each scanning every resource
         resources_by_type = defaultdict(list)
-        for resource in resources:
-            if not resource.has_error() and resource.is_valid():
-                resources_by_type[resource.resource_type].append(resource)
+        for arn, resource in resources_dict.items():
+            resources_by_type[resource.resource_type].append((arn, resource))
+        
+        # Index the MERGE keys before writing so MERGE does not scan whole labels
+        self._ensure_label_indexes(resources_by_label.keys())
         
-        # Process each resource type
-        for resource_type, type_resources in resources_by_type.items():
-            self._add_resources_of_type(resource_type, type_resources)
+        # Write labels in parallel; each label is owned by a single writer so
+        # concurrent MERGEs never contend for the same label locks
+        merged_nodes = self._write_labels_parallel(resources_by_label)
         
-        with self.driver.session() as session:
+        # Link the merged nodes to the account only after the parallel phase, so the
+        # label writers never contend for the single Account node
+        self._create_account_relationships(merged_nodes)
+        
+        # Component nodes are merged by arn too, and matched again when linked
+        self._ensure_label_indexes(COMPONENT_LABELS, keys=('arn',))
+        
+        with self._session() as session:
             # Create route rules from route tables
-            self._create_route_rules(session, resources_dict)
+            self._create_route_rules(session, resources_by_type)
             
             # Create enhanced service components
-            self._create_enhanced_service_components(session, resources_dict)
+            self._create_enhanced_service_components(session, resources_by_type)
             
             # Create relationships between resources
             self._create_resource_relationships(resources)
@@ -197,105 +540,146 @@ class Neo4jClient:
         
         self.logger.info(f"✓ Added {self.stats['nodes_created']} nodes and {self.stats['relationships_created']} relationships")
     
-    def _add_resources_of_type(self, resource_type: str, resources: List[ResourceInfo]):
-        """Add resources of a specific type to graph"""
-        self.logger.debug(f"Adding {len(resources)} resources of type {resource_type}")
-        
-        try:
-            with self.driver.session() as session:
-                for resource in resources:
-                    self._create_resource_node(session, resource)
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to add resources of type {resource_type}: {e}")
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Thread-safe increment of a Neo4j statistic"""
+        with self._stats_lock:
+            self.stats[key] += amount
     
-    def _create_resource_node(self, session, resource: ResourceInfo):
-        """Create a resource node with extracted type from AWS resource type"""
-        try:
-            # Extract node type from AWS resource type (AWS::EC2::PrefixList -> PrefixList)
-            node_type = self._extract_node_type(resource.resource_type)
-            
-            # Flatten properties for Neo4j storage
-            flattened_props = self._flatten_properties(resource.properties)
-            
-            # Build node properties
-            node_props = {
-                'aws_resource_type': resource.resource_type,
-                'identifier': resource.identifier,
-                'arn': resource.arn,
-                'service': resource.service,
-                'account_id': self._account_id,
-                'updated_at': 'datetime()'
+    def _write_labels_parallel(self, resources_by_label: Dict[str, Dict[str, List[ResourceInfo]]]
+                               ) -> List[Tuple[str, str, List[str]]]:
+        """Write resource nodes using a pool of writer sessions, one label per task.
+        
+        Returns the (label, MERGE key, key values) groups of the nodes that were written.
+        """
+        merged_nodes = []
+        workers = min(self.config.graph_writers, len(resources_by_label))
+        if workers <= 1:
+            for types_for_label in resources_by_label.values():
+                merged_nodes.extend(self._add_resources_of_label(types_for_label))
+            return merged_nodes
+        
+        self.logger.info(f"Writing {len(resources_by_label)} node labels with {workers} parallel writers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_label = {
+                executor.submit(self._add_resources_of_label, types_for_label): label
+                for label, types_for_label in resources_by_label.items()
             }
             
-            # Add region if not global service
-            if not self._is_global_service(resource.service):
-                node_props['region'] = resource.region
-            
-            # Add flattened properties
-            node_props.update(flattened_props)
-            
-            # Determine unique identifier for MERGE operation
-            # Use ARN if available, otherwise use identifier + account + region + resource_type
-            if resource.arn and resource.arn.strip():
-                unique_key = 'arn'
-                unique_value = resource.arn
-                query = f"""
-                MERGE (r:{node_type} {{arn: $unique_value}})
-                SET r += $props
-                RETURN r
-                """
-            else:
-                unique_key = 'composite_id'
-                region_part = resource.region if not self._is_global_service(resource.service) else 'global'
-                unique_value = f"{resource.identifier}:{self._account_id}:{region_part}:{resource.resource_type}"
-                node_props['composite_id'] = unique_value
-                query = f"""
-                MERGE (r:{node_type} {{composite_id: $unique_value}})
-                SET r += $props
-                RETURN r
-                """
-            
-            result = session.run(query, unique_value=unique_value, props=node_props)
-            if result.single():
-                self.stats['nodes_created'] += 1
+            for future in as_completed(future_to_label):
+                try:
+                    merged_nodes.extend(future.result())
+                except Exception as e:
+                    self.logger.error(f"Failed to write {future_to_label[future]} nodes: {e}")
+        
+        return merged_nodes
+    
+    def _add_resources_of_label(self, types_for_label: Dict[str, List[ResourceInfo]]) -> List[Tuple[str, str, List[str]]]:
+        """Add all resource types that share a node label"""
+        merged_nodes = []
+        for resource_type, type_resources in types_for_label.items():
+            merged_nodes.extend(self._add_resources_of_type(resource_type, type_resources))
+        return merged_nodes
+    
+    def _add_resources_of_type(self, resource_type: str, resources: List[ResourceInfo]) -> List[Tuple[str, str, List[str]]]:
+        """Add resources of a specific type to graph using batched UNWIND writes.
+        
+        Returns the (label, MERGE key, key values) groups of the batches that were written.
+        """
+        self.logger.debug("Adding %s resources of type %s", len(resources), resource_type)
+        
+        # Extract node type from AWS resource type (AWS::EC2::PrefixList -> PrefixList)
+        node_type = self._extract_node_type(resource_type)
+        
+        # Group rows by the property used as the MERGE key
+        rows_by_key = {'arn': [], 'composite_id': []}
+        for resource in resources:
+            try:
+                unique_key, row = self._build_resource_row(resource)
+                rows_by_key[unique_key].append(row)
+            except Exception as e:
+                self.logger.error(f"Failed to create resource node {resource.identifier}: {e}")
+        
+        # A failed batch is logged and skipped; the remaining batches are still written
+        merged_nodes = []
+        for unique_key, rows in rows_by_key.items():
+            for start in range(0, len(rows), NODE_BATCH_SIZE):
+                batch = rows[start:start + NODE_BATCH_SIZE]
+                try:
+                    self._merge_resource_batch(node_type, unique_key, batch)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to add {resource_type} resources {start + 1}-{start + len(batch)} "
+                        f"of {len(rows)} (by {unique_key}): {e}"
+                    )
+                    continue
+                merged_nodes.append((node_type, unique_key, [row['unique_value'] for row in batch]))
+        
+        return merged_nodes
+    
+    def _build_resource_row(self, resource: ResourceInfo) -> Tuple[str, Dict[str, Any]]:
+        """Build the UNWIND row for a resource node and return it with its MERGE key"""
+        # Flatten properties for Neo4j storage
+        flattened_props = self._flatten_properties(resource.properties)
+        
+        # Build node properties
+        node_props = {
+            'aws_resource_type': resource.resource_type,
+            'identifier': resource.identifier,
+            'arn': resource.arn,
+            'service': resource.service,
+            'account_id': self._account_id,
+            'updated_at': 'datetime()'
+        }
+        
+        # Add region if not global service
+        is_global = self._is_global_service(resource.service)
+        if not is_global:
+            node_props['region'] = resource.region
+        
+        # Add flattened properties
+        node_props.update(flattened_props)
+        
+        # Determine unique identifier for MERGE operation
+        # Use ARN if available, otherwise use identifier + account + region + resource_type
+        if resource.arn and resource.arn.strip():
+            unique_key = 'arn'
+            unique_value = resource.arn
+        else:
+            unique_key = 'composite_id'
+            region_part = resource.region if not is_global else 'global'
+            unique_value = f"{resource.identifier}:{self._account_id}:{region_part}:{resource.resource_type}"
+            node_props['composite_id'] = unique_value
+        
+        return unique_key, {'unique_value': unique_value, 'props': node_props}
+    
+    def _merge_resource_batch(self, node_type: str, unique_key: str, rows: List[Dict[str, Any]]):
+        """MERGE a batch of resource nodes of one type"""
+        query = _merge_nodes_query(node_type, unique_key)
+        records = self._execute_write(query, rows=rows).records
+        if records:
+            self._increment_stat('nodes_created', records[0]['merged'])
+    
+    def _create_account_relationships(self, merged_nodes: List[Tuple[str, str, List[str]]]):
+        """Create OWNS relationships between the account and the merged resource nodes, one batch at a time"""
+        if not self._account_id:
+            return
+        
+        for node_type, unique_key, unique_values in merged_nodes:
+            try:
+                query = _account_owns_query(node_type, unique_key)
+                self._execute_write(query, account_id=self._account_id, unique_values=unique_values)
+                self._increment_stat('relationships_created', len(unique_values))
                 
-                # Create relationship to account - use the unique identifier we just used
-                if self._account_id:
-                    self._create_account_relationship(session, unique_value, node_type, unique_key)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create resource node {resource.identifier}: {e}")
+            except Exception as e:
+                self.logger.debug("Failed to create account relationships for %s %s nodes: %s", len(unique_values), node_type, e)
     
     def _extract_node_type(self, resource_type: str) -> str:
         """Extract clean node type from AWS resource type"""
         # AWS::EC2::PrefixList -> PrefixList
         # AWS::S3::Bucket -> Bucket
         # AWS::IAM::Role -> Role
-        
-        if not resource_type.startswith('AWS::'):
-            return 'UnknownResource'
-        
-        parts = resource_type.split('::')
-        if len(parts) >= 3:
-            return parts[2]  # Extract the actual resource type
-        
-        return 'UnknownResource'
-    
-    def _create_account_relationship(self, session, unique_value: str, node_type: str, unique_key: str = 'arn'):
-        """Create OWNS relationship between account and resource"""
-        try:
-            query = f"""
-            MATCH (a:Account {{id: $account_id}})
-            MATCH (r:{node_type} {{{unique_key}: $unique_value}})
-            MERGE (a)-[:OWNS]->(r)
-            """
-            
-            session.run(query, account_id=self._account_id, unique_value=unique_value)
-            self.stats['relationships_created'] += 1
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to create account relationship for {unique_value}: {e}")
+        return _node_type_for(resource_type)
     
     def _create_resource_relationships(self, resources: List[ResourceInfo]):
         """Create intelligent relationships between resources based on actual usage"""
@@ -305,6 +689,7 @@ class Neo4jClient:
         arn_to_resource = {}
         id_to_resources = {}
         name_to_resources = {}
+        has_security_groups = False
         
         for resource in resources:
             if resource.has_error():
@@ -320,37 +705,54 @@ class Neo4jClient:
                     id_to_resources[resource.identifier] = []
                 id_to_resources[resource.identifier].append(resource)
             
-            # Map by common name patterns
-            name_keys = self._extract_name_keys(resource)
-            for name_key in name_keys:
-                if name_key not in name_to_resources:
-                    name_to_resources[name_key] = []
-                name_to_resources[name_key].append(resource)
+            # Map by common name patterns; names are only matched against roles,
+            # so other resources' properties are not walked
+            if 'Role' in resource.resource_type:
+                name_keys = self._extract_name_keys(resource)
+                for name_key in name_keys:
+                    if name_key not in name_to_resources:
+                        name_to_resources[name_key] = []
+                    name_to_resources[name_key].append(resource)
+            
+            if 'SecurityGroup' in resource.resource_type:
+                has_security_groups = True
+        
+        # Skip property walks that cannot match anything in this inventory
+        skipped_walks = set()
+        if not has_security_groups:
+            skipped_walks.add('security_groups')
+        if not name_to_resources:
+            skipped_walks.add('roles')
+        if not any(arn.startswith('arn:aws:iam') for arn in arn_to_resource):
+            skipped_walks.add('policies')
+        
+        # Group relationships by label pair and type so each group is written
+        # with a few UNWIND statements instead of one round trip per relationship
+        rows_by_group = defaultdict(list)
+        for resource in resources:
+            if resource.has_error():
+                continue
+            
+            # Find usage-based relationships
+            relationships = self._analyze_resource_usage(
+                resource, arn_to_resource, id_to_resources, name_to_resources, skipped_walks
+            )
+            
+            source_type = self._extract_node_type(resource.resource_type)
+            for rel_type, target_resource in relationships:
+                target_type = self._extract_node_type(target_resource.resource_type)
+                rows_by_group[(source_type, target_type, rel_type)].append(
+                    {'source_arn': resource.arn, 'target_arn': target_resource.arn}
+                )
         
         relationship_count = 0
-        
-        with self.driver.session() as session:
-            for resource in resources:
-                if resource.has_error():
-                    continue
-                
-                # Find usage-based relationships
-                relationships = self._analyze_resource_usage(
-                    resource, arn_to_resource, id_to_resources, name_to_resources
-                )
-                
-                for rel_type, target_resource in relationships:
-                    try:
-                        source_type = self._extract_node_type(resource.resource_type)
-                        target_type = self._extract_node_type(target_resource.resource_type)
-                        
-                        self._create_usage_relationship(
-                            session, resource.arn, target_resource.arn, 
-                            source_type, target_type, rel_type
-                        )
-                        relationship_count += 1
-                    except Exception as e:
-                        self.logger.debug(f"Failed to create relationship {rel_type}: {e}")
+        for group, rows in rows_by_group.items():
+            for start in range(0, len(rows), NODE_BATCH_SIZE):
+                batch = rows[start:start + NODE_BATCH_SIZE]
+                try:
+                    relationship_count += self._create_usage_relationships(*group, batch)
+                except Exception as e:
+                    self.logger.debug("Failed to create %s %s relationships: %s", len(batch), group[2], e)
         
         self.logger.info(f"✓ Created {relationship_count} usage-based relationships")
     
@@ -385,7 +787,8 @@ class Neo4jClient:
         return list(set(name_keys))  # Remove duplicates
     
     def _analyze_resource_usage(self, resource: ResourceInfo, arn_to_resource: Dict, 
-                               id_to_resources: Dict, name_to_resources: Dict) -> List[Tuple[str, ResourceInfo]]:
+                               id_to_resources: Dict, name_to_resources: Dict,
+                               skipped_walks: frozenset = frozenset()) -> List[Tuple[str, ResourceInfo]]:
         """Analyze how this resource uses other resources"""
         relationships = []
         
@@ -396,10 +799,13 @@ class Neo4jClient:
         relationships.extend(self._find_arn_references(resource, arn_to_resource))
         relationships.extend(self._find_id_references(resource, id_to_resources))
         relationships.extend(self._find_vpc_relationships(resource, id_to_resources))
-        relationships.extend(self._find_security_group_relationships(resource, id_to_resources))
+        if 'security_groups' not in skipped_walks:
+            relationships.extend(self._find_security_group_relationships(resource, id_to_resources))
         relationships.extend(self._find_subnet_relationships(resource, id_to_resources))
-        relationships.extend(self._find_role_relationships(resource, name_to_resources))
-        relationships.extend(self._find_policy_relationships(resource, arn_to_resource))
+        if 'roles' not in skipped_walks:
+            relationships.extend(self._find_role_relationships(resource, name_to_resources))
+        if 'policies' not in skipped_walks:
+            relationships.extend(self._find_policy_relationships(resource, arn_to_resource))
         
         return relationships
     
@@ -523,7 +929,7 @@ class Neo4jClient:
             return relationships
         
         # Look for IAM role references
-        role_fields = ['RoleName', 'RoleArn', 'IamInstanceProfile']
+        role_fields = ROLE_REFERENCE_FIELDS
         
         def find_roles(obj):
             if isinstance(obj, dict):
@@ -531,7 +937,7 @@ class Neo4jClient:
                     if key in role_fields:
                         if isinstance(value, str):
                             # Extract role name from ARN if needed
-                            role_name = value.split('/')[-1] if '/' in value else value
+                            role_name = _role_name_from_reference(value)
                             if role_name in name_to_resources:
                                 for role_resource in name_to_resources[role_name]:
                                     if 'Role' in role_resource.resource_type:
@@ -580,79 +986,42 @@ class Neo4jClient:
     
     def _determine_usage_relationship(self, source: ResourceInfo, target: ResourceInfo, path: str, key: str) -> str:
         """Determine the relationship type based on how source uses target"""
-        key_lower = key.lower()
-        path_lower = path.lower()
-        source_type = source.resource_type
-        target_type = target.resource_type
-        
-        # Logging relationships
-        if 'log' in key_lower or 'logging' in path_lower:
-            return 'LOGS_TO'
-        
-        # Network relationships
-        if 'vpc' in key_lower and 'VPC' in target_type:
-            return 'DEPLOYED_IN'
-        if 'subnet' in key_lower and 'Subnet' in target_type:
-            return 'DEPLOYED_IN'
-        if 'securitygroup' in key_lower or 'groupid' in key_lower:
-            return 'PROTECTED_BY'
-        
-        # IAM relationships
-        if 'role' in key_lower and 'Role' in target_type:
-            return 'ASSUMES'
-        if 'policy' in key_lower and 'Policy' in target_type:
-            return 'HAS_POLICY'
-        
-        # Storage relationships
-        if 'volume' in key_lower and 'Volume' in target_type:
-            return 'USES_VOLUME'
-        if 'snapshot' in key_lower and 'Snapshot' in target_type:
-            return 'CREATED_FROM'
-        
-        # Network routing
-        if 'route' in key_lower or 'gateway' in key_lower:
-            return 'ROUTES_THROUGH'
-        
-        # Load balancer relationships
-        if 'loadbalancer' in key_lower or 'targetgroup' in key_lower:
-            return 'LOAD_BALANCED_BY'
-        
-        # Database relationships
-        if 'db' in key_lower and any(db in target_type for db in ['DB', 'Database', 'RDS']):
-            return 'CONNECTS_TO'
-        
-        # Default fallback
-        return 'USES'
+        return _usage_relationship_type(target.resource_type, path, key)
     
-    def _create_usage_relationship(self, session, source_arn: str, target_arn: str, 
-                                  source_type: str, target_type: str, rel_type: str):
-        """Create a usage-based relationship between two resource nodes"""
-        query = f"""
-        MATCH (source:{source_type} {{arn: $source_arn}})
-        MATCH (target:{target_type} {{arn: $target_arn}})
-        MERGE (source)-[r:{rel_type}]->(target)
-        SET r.created_at = datetime()
-        RETURN r
-        """
-        
-        result = session.run(query, source_arn=source_arn, target_arn=target_arn)
-        if result.single():
-            self.stats['relationships_created'] += 1
-            self.logger.debug(f"Created {rel_type}: {source_type} -> {target_type}")
+    def _create_usage_relationships(self, source_type: str, target_type: str, rel_type: str,
+                                    rows: List[Dict[str, str]]) -> int:
+        """Create a batch of usage-based relationships between two node labels"""
+        query = _usage_relationship_query(source_type, target_type, rel_type)
+        records = self._execute_write(query, rows=rows).records
+        created = records[0]['created'] if records else 0
+        if created:
+            self._increment_stat('relationships_created', created)
+            self.logger.debug("Created %s %s: %s -> %s", created, rel_type, source_type, target_type)
+        return created
     
     def _flatten_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Flatten nested properties for Neo4j storage"""
         flattened = {}
-        
-        def flatten_dict(obj, prefix=""):
-            for key, value in obj.items():
+        if not isinstance(properties, dict):
+            return flattened
+        
+        # Walk nested dicts with an explicit stack of item iterators instead of a
+        # recursive closure; a nested dict is pushed and resumed from, keeping key order
+        stack = [(iter(properties.items()), "", 1)]
+        while stack:
+            items, prefix, depth = stack[-1]
+            for key, value in items:
                 new_key = f"{prefix}_{key}" if prefix else key
                 
                 if isinstance(value, dict):
-                    flatten_dict(value, new_key)
+                    if depth < FLATTEN_MAX_DEPTH:
+                        stack.append((iter(value.items()), new_key, depth + 1))
+                        break
+                    # Keep deeper structures whole instead of exploding them into more keys
+                    flattened[new_key] = json_utils.dumps(value)
                 elif isinstance(value, list):
                     # Convert lists to JSON strings
-                    flattened[new_key] = json.dumps(value) if value else "[]"
+                    flattened[new_key] = json_utils.dumps(value) if value else "[]"
                 elif isinstance(value, (str, int, float, bool)):
                     flattened[new_key] = value
                 elif value is None:
@@ -660,16 +1029,14 @@ class Neo4jClient:
                 else:
                     # Convert other types to strings
                     flattened[new_key] = str(value)
-        
-        if isinstance(properties, dict):
-            flatten_dict(properties)
+            else:
+                stack.pop()
         
         return flattened
     
     def _is_global_service(self, service: str) -> bool:
         """Check if service is global (no region property needed)"""
-        global_services = {'iam', 'organizations', 'route53', 'waf', 'wafv2', 'artifacts', 'controltower'}
-        return service.lower() in global_services
+        return service.lower() in GLOBAL_SERVICES
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get Neo4j operation statistics"""
@@ -688,7 +1055,7 @@ class Neo4jClient:
     def execute_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Execute a custom Cypher query"""
         try:
-            with self.driver.session() as session:
+            with self._session() as session:
                 result = session.run(query, parameters or {})
                 return [record.data() for record in result]
         except Exception as e:
@@ -712,11 +1079,21 @@ class Neo4jClient:
             return 0
     
     def get_service_client(self, service_name: str):
-        """Get AWS service client"""
+        """Get the shared AWS service client, reusing discovery's clients when possible"""
         try:
             import boto3
-            session = boto3.Session()
-            return session.client(service_name, region_name=self.config.region)
+            from core.base_service import get_shared_client, get_client_config
+            with self._aws_session_lock:
+                if self._aws_session is None:
+                    profile = self.config.profile
+                    self._aws_session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+            
+            return get_shared_client(
+                self._aws_session,
+                service_name,
+                self.config.region,
+                get_client_config(max(10, self.config.max_workers))
+            )
         except Exception as e:
             self.logger.error(f"Failed to create {service_name} client: {e}")
             return None
@@ -725,360 +1102,390 @@ class Neo4jClient:
         """Get AWS account ID"""
         return self._account_id or "unknown"
     
-    def _create_route_rules(self, session, resources: Dict[str, Any]):
+    def _create_route_rules(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create individual RouteRule nodes from RouteTable resources"""
         try:
             ec2_client = self.get_service_client('ec2')
             if not ec2_client:
                 return
                 
-            route_tables = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::EC2::RouteTable'
-            ]
+            route_tables = resources_by_type.get('AWS::EC2::RouteTable', [])
             if not route_tables:
                 self.logger.debug("No route tables found for route rule extraction")
                 return
                 
             self.logger.info(f"Processing {len(route_tables)} route tables for route rule extraction")
             
+            # Loop invariants, read once instead of per route
+            region = self.config.region
+            account_id = self._get_account_id()
+            
+            # Index possible route targets once so each route resolves them by lookup
+            target_arns = {}
+            for target_type in set(ROUTE_TARGET_TYPES.values()):
+                for arn, info in resources_by_type.get(target_type, []):
+                    if info.identifier:
+                        target_arns.setdefault((target_type, info.identifier), arn)
+            
+            # Describe the route tables in chunks rather than one call per table; the
+            # filter form skips ids that no longer exist instead of failing the chunk
+            route_table_ids = [info.identifier for _, info in route_tables if info.identifier]
+            described_tables = {}
+            for start in range(0, len(route_table_ids), DESCRIBE_FILTER_BATCH_SIZE):
+                chunk = route_table_ids[start:start + DESCRIBE_FILTER_BATCH_SIZE]
+                try:
+                    described_tables.update(self._describe_all(
+                        ec2_client, 'describe_route_tables', 'RouteTables', 'RouteTableId',
+                        Filters=[{'Name': 'route-table-id', 'Values': chunk}]
+                    ))
+                except Exception as e:
+                    self.logger.warning(f"Failed to get detailed routes for {len(chunk)} route tables: {e}")
+            
+            route_rows = []
             for route_table_arn, route_table_info in route_tables:
-                route_table_id = route_table_info.get('identifier', '')
-                if not route_table_id:
+                route_table_id = route_table_info.identifier
+                route_table = described_tables.get(route_table_id)
+                if route_table is None:
                     continue
                     
                 try:
-                    response = ec2_client.describe_route_tables(RouteTableIds=[route_table_id])
-                    for route_table in response.get('RouteTables', []):
-                        routes = route_table.get('Routes', [])
-                        for i, route in enumerate(routes):
-                            route_id = f"{route_table_id}_route_{i}"
-                            route_arn = f"arn:aws:ec2:{self.config.region}:{self._get_account_id()}:route/{route_id}"
-                            
-                            route_properties = {
-                                'route_id': route_id,
-                                'route_table_id': route_table_id,
-                                'destination_cidr_block': route.get('DestinationCidrBlock', ''),
-                                'destination_ipv6_cidr_block': route.get('DestinationIpv6CidrBlock', ''),
-                                'destination_prefix_list_id': route.get('DestinationPrefixListId', ''),
-                                'gateway_id': route.get('GatewayId', ''),
-                                'instance_id': route.get('InstanceId', ''),
-                                'instance_owner_id': route.get('InstanceOwnerId', ''),
-                                'network_interface_id': route.get('NetworkInterfaceId', ''),
-                                'transit_gateway_id': route.get('TransitGatewayId', ''),
-                                'vpc_peering_connection_id': route.get('VpcPeeringConnectionId', ''),
-                                'nat_gateway_id': route.get('NatGatewayId', ''),
-                                'carrier_gateway_id': route.get('CarrierGatewayId', ''),
-                                'local_gateway_id': route.get('LocalGatewayId', ''),
-                                'core_network_arn': route.get('CoreNetworkArn', ''),
-                                'state': route.get('State', ''),
-                                'origin': route.get('Origin', ''),
-                                'arn': route_arn,
-                                'resource_type': 'AWS::EC2::RouteRule',
-                                'service': 'ec2',
-                                'region': self.config.region,
-                                'account_id': self._get_account_id()
-                            }
-                            
-                            route_properties = {k: v for k, v in route_properties.items() if v}
-                            
-                            create_route_query = """
-                            MERGE (rr:RouteRule {arn: $arn})
-                            SET rr += $properties
-                            """
-                            session.run(create_route_query, arn=route_arn, properties=route_properties)
-                            
-                            account_route_query = """
-                            MATCH (account:Account {id: $account_id})
-                            MATCH (rr:RouteRule {arn: $route_arn})
-                            MERGE (account)-[:OWNS]->(rr)
-                            """
-                            session.run(account_route_query, 
-                                       account_id=self._get_account_id(),
-                                       route_arn=route_arn)
-                            
-                            relationship_query = """
-                            MATCH (rt:RouteTable {arn: $route_table_arn})
-                            MATCH (rr:RouteRule {arn: $route_arn})
-                            MERGE (rt)-[:HAS_ROUTE]->(rr)
-                            """
-                            session.run(relationship_query, 
-                                       route_table_arn=route_table_arn, 
-                                       route_arn=route_arn)
-                            
-                            self._create_route_target_relationships(session, route_properties, resources)
-                            self.stats['nodes_created'] += 1
-                            self.stats['relationships_created'] += 2
-                            
+                    routes = route_table.get('Routes', [])
+                    for i, route in enumerate(routes):
+                        route_id = f"{route_table_id}_route_{i}"
+                        route_arn = f"arn:aws:ec2:{region}:{account_id}:route/{route_id}"
+                        
+                        # Only copy the fields the route actually has, so no cleanup pass is needed
+                        route_properties = {
+                            prop: route[key] for key, prop in ROUTE_FIELDS.items() if route.get(key)
+                        }
+                        route_properties.update({
+                            'route_id': route_id,
+                            'route_table_id': route_table_id,
+                            'arn': route_arn,
+                            'resource_type': 'AWS::EC2::RouteRule',
+                            'service': 'ec2',
+                            'region': region,
+                            'account_id': account_id
+                        })
+                        route_rows.append({
+                            'arn': route_arn,
+                            'route_table_arn': route_table_arn,
+                            'properties': route_properties
+                        })
+                        
                 except Exception as e:
-                    self.logger.warning(f"Failed to get detailed routes for route table {route_table_id}: {e}")
+                    self.logger.warning(f"Failed to create route rules for route table {route_table_id}: {e}")
                     continue
-                    
-            self.logger.info("Route rule creation completed")
+            
+            # Write the rules with their OWNS and HAS_ROUTE links, then point them at
+            # their targets, all in one transaction
+            link_statements = self._route_target_statements(route_rows, target_arns)
+            if self._write_component_rows(
+                session,
+                [(ROUTE_RULE_QUERY, route_rows, {'account_id': account_id})] + link_statements,
+                "route rules"
+            ):
+                self.stats['nodes_created'] += len(route_rows)
+                self.stats['relationships_created'] += 2 * len(route_rows) + sum(
+                    len(links) for _, links, _ in link_statements
+                )
+                self.logger.info("Route rule creation completed")
         except Exception as e:
             self.logger.error(f"Failed to create route rules: {e}")
     
-    def _create_route_target_relationships(self, session, route_properties: Dict[str, Any], resources: Dict[str, Any]):
-        """Create relationships from route rules to their target resources"""
-        route_arn = route_properties.get('arn')
-        
-        target_mappings = {
-            'gateway_id': 'AWS::EC2::InternetGateway',
-            'nat_gateway_id': 'AWS::EC2::NatGateway', 
-            'instance_id': 'AWS::EC2::Instance',
-            'network_interface_id': 'AWS::EC2::NetworkInterface',
-            'transit_gateway_id': 'AWS::EC2::TransitGateway',
-            'vpc_peering_connection_id': 'AWS::EC2::VPCPeeringConnection'
-        }
+    def _route_target_statements(self, route_rows: List[Dict[str, Any]],
+                                 target_arns: Dict[Tuple[str, str], str]) -> List[Tuple[str, List[Dict[str, str]], Dict]]:
+        """Build the statements linking route rules to their target resources, found by (type, identifier)"""
+        # Group the links by target label so each label is written with one UNWIND
+        links_by_label = defaultdict(list)
+        for row in route_rows:
+            route_properties = row['properties']
+            for prop_name, resource_type in ROUTE_TARGET_TYPES.items():
+                target_id = route_properties.get(prop_name)
+                if target_id and target_id != 'local':
+                    target_arn = target_arns.get((resource_type, target_id))
+                    if target_arn:
+                        links_by_label[self._extract_node_type(resource_type)].append(
+                            {'route_arn': row['arn'], 'target_arn': target_arn}
+                        )
         
-        for prop_name, resource_type in target_mappings.items():
-            target_id = route_properties.get(prop_name)
-            if target_id and target_id != 'local':
-                target_arn = None
-                for arn, info in resources.items():
-                    if (info.get('resource_type') == resource_type and 
-                        info.get('identifier') == target_id):
-                        target_arn = arn
-                        break
-                
-                if target_arn:
-                    safe_resource_type = self._extract_node_type(resource_type)
-                    relationship_query = f"""
-                    MATCH (rr:RouteRule {{arn: $route_arn}})
-                    MATCH (target:{safe_resource_type} {{arn: $target_arn}})
-                    MERGE (rr)-[:ROUTES_TO]->(target)
-                    """
-                    session.run(relationship_query, route_arn=route_arn, target_arn=target_arn)
-                    self.stats['relationships_created'] += 1
+        return [
+            (_routes_to_query(safe_resource_type), links, {})
+            for safe_resource_type, links in links_by_label.items()
+        ]
     
-    def _create_enhanced_service_components(self, session, resources: Dict[str, Any]):
+    def _create_enhanced_service_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create detailed sub-components for RDS, ElastiCache, MQ, and API Gateway"""
         try:
             self.logger.info("Creating enhanced service components...")
-            self._create_rds_components(session, resources)
-            self._create_elasticache_components(session, resources)
-            self._create_mq_components(session, resources)
-            self._create_apigateway_components(session, resources)
-            self._create_transit_gateway_components(session, resources)
-            self._create_vpc_peering_components(session, resources)
+            self._create_rds_components(session, resources_by_type)
+            self._create_elasticache_components(session, resources_by_type)
+            self._create_mq_components(session, resources_by_type)
+            self._create_apigateway_components(session, resources_by_type)
+            self._create_transit_gateway_components(session, resources_by_type)
+            self._create_vpc_peering_components(session, resources_by_type)
         except Exception as e:
             self.logger.error(f"Failed to create enhanced service components: {e}")
     
-    def _create_rds_components(self, session, resources: Dict[str, Any]):
+    def _write_component_rows(self, session, statements: List[Tuple[str, List[Dict[str, Any]], Dict[str, Any]]],
+                              description: str) -> bool:
+        """Write one helper's collected rows in a single short managed transaction.
+        
+        Each statement is an UNWIND $rows query with its rows and extra parameters, run
+        in NODE_BATCH_SIZE chunks. Helpers call this after all of their AWS calls, so no
+        locks are held across network I/O. A failing statement rolls the helper's writes
+        back and is logged once; returns whether the rows were committed, so callers only
+        count statistics for committed writes.
+        """
+        statements = [statement for statement in statements if statement[1]]
+        if not statements:
+            return True
+        
+        def write(tx):
+            for query, rows, parameters in statements:
+                for start in range(0, len(rows), NODE_BATCH_SIZE):
+                    tx.run(query, rows=rows[start:start + NODE_BATCH_SIZE], **parameters).consume()
+        
+        try:
+            session.execute_write(write)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to write {description}: {e}")
+            return False
+    
+    def _describe_all(self, client, operation: str, result_key: str, id_key: str, **kwargs) -> Dict[str, Dict]:
+        """Page through a describe operation and index the returned items by their identifier"""
+        items_by_id = {}
+        for page in client.get_paginator(operation).paginate(**kwargs):
+            for item in page.get(result_key, []):
+                items_by_id[item.get(id_key)] = item
+        return items_by_id
+    
+    def _fetch_concurrently(self, fetch, keys: List[str], description: str) -> Dict[str, Any]:
+        """Run a per-resource AWS call for every key on a thread pool and map each key to its response.
+        
+        Only the AWS calls run on worker threads; callers write the results to Neo4j
+        on their own session. Failed keys are logged and left out of the result.
+        """
+        responses = {}
+        workers = min(self.config.max_workers, len(keys))
+        if workers <= 1:
+            for key in keys:
+                try:
+                    responses[key] = fetch(key)
+                except Exception as e:
+                    self.logger.warning(f"Failed to get detailed info for {description} {key}: {e}")
+            return responses
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_key = {executor.submit(fetch, key): key for key in keys}
+            for future in as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    responses[key] = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Failed to get detailed info for {description} {key}: {e}")
+        
+        return responses
+    
+    def _create_rds_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create RDS sub-components: instances, clusters, snapshots, parameter groups"""
         try:
             rds_client = self.get_service_client('rds')
             if not rds_client:
                 return
                 
-            rds_clusters = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::RDS::DBCluster'
-            ]
+            rds_clusters = resources_by_type.get('AWS::RDS::DBCluster', [])
+            
+            if not rds_clusters:
+                return
+            
+            # Describe every cluster in a few paginated calls instead of one call per cluster
+            clusters_by_id = self._describe_all(
+                rds_client, 'describe_db_clusters', 'DBClusters', 'DBClusterIdentifier'
+            )
             
-            # Process RDS Clusters
+            region = self.config.region
+            account_id = self._get_account_id()
+            
+            # Process RDS Clusters, collecting rows for batched writes
+            member_rows = []
+            param_group_rows = []
             for cluster_arn, cluster_info in rds_clusters:
-                cluster_id = cluster_info.get('identifier', '')
+                cluster_id = cluster_info.identifier
                 if not cluster_id:
                     continue
                     
+                cluster = clusters_by_id.get(cluster_id)
+                if cluster is None:
+                    self.logger.debug("RDS cluster %s not found in describe_db_clusters", cluster_id)
+                    continue
+                
                 try:
-                    response = rds_client.describe_db_clusters(DBClusterIdentifier=cluster_id)
-                    for cluster in response.get('DBClusters', []):
-                        # Create cluster members
-                        for member in cluster.get('DBClusterMembers', []):
-                            instance_id = member.get('DBInstanceIdentifier')
-                            if instance_id:
-                                instance_arn = f"arn:aws:rds:{self.config.region}:{self._get_account_id()}:db:{instance_id}"
-                                member_query = """
-                                MERGE (instance:RDSClusterMember {
-                                    arn: $instance_arn,
-                                    instance_id: $instance_id,
-                                    is_writer: $is_writer,
-                                    promotion_tier: $promotion_tier,
-                                    resource_type: 'AWS::RDS::DBClusterMember',
-                                    service: 'rds',
-                                    region: $region,
-                                    account_id: $account_id
-                                })
-                                WITH instance
-                                MATCH (account:Account {id: $account_id})
-                                MERGE (account)-[:OWNS]->(instance)
-                                WITH instance
-                                MATCH (cluster:DBCluster {arn: $cluster_arn})
-                                MERGE (cluster)-[:HAS_MEMBER]->(instance)
-                                """
-                                session.run(member_query,
-                                           cluster_arn=cluster_arn,
-                                           instance_arn=instance_arn,
-                                           instance_id=instance_id,
-                                           is_writer=member.get('IsClusterWriter', False),
-                                           promotion_tier=member.get('PromotionTier', 0),
-                                           region=self.config.region,
-                                           account_id=self._get_account_id())
-                                self.stats['nodes_created'] += 1
-                                self.stats['relationships_created'] += 2
-                        
-                        # Create parameter group relationships
-                        param_group = cluster.get('DBClusterParameterGroup')
-                        if param_group:
-                            param_group_arn = f"arn:aws:rds:{self.config.region}:{self._get_account_id()}:cluster-pg:{param_group}"
-                            param_query = """
-                            MERGE (pg:RDSParameterGroup {
-                                arn: $param_group_arn,
-                                name: $param_group,
-                                resource_type: 'AWS::RDS::DBClusterParameterGroup',
-                                service: 'rds',
-                                region: $region,
-                                account_id: $account_id
+                    # Cluster members
+                    for member in cluster.get('DBClusterMembers', []):
+                        instance_id = member.get('DBInstanceIdentifier')
+                        if instance_id:
+                            member_rows.append({
+                                'cluster_arn': cluster_arn,
+                                'instance_arn': f"arn:aws:rds:{region}:{account_id}:db:{instance_id}",
+                                'instance_id': instance_id,
+                                'is_writer': member.get('IsClusterWriter', False),
+                                'promotion_tier': member.get('PromotionTier', 0)
                             })
-                            WITH pg
-                            MATCH (account:Account {id: $account_id})
-                            MERGE (account)-[:OWNS]->(pg)
-                            WITH pg
-                            MATCH (cluster:DBCluster {arn: $cluster_arn})
-                            MERGE (cluster)-[:USES_PARAMETER_GROUP]->(pg)
-                            """
-                            session.run(param_query,
-                                       cluster_arn=cluster_arn,
-                                       param_group_arn=param_group_arn,
-                                       param_group=param_group,
-                                       region=self.config.region,
-                                       account_id=self._get_account_id())
-                            self.stats['nodes_created'] += 1
-                            self.stats['relationships_created'] += 2
-                        
+                    
+                    # Parameter group relationships
+                    param_group = cluster.get('DBClusterParameterGroup')
+                    if param_group:
+                        param_group_rows.append({
+                            'cluster_arn': cluster_arn,
+                            'param_group_arn': f"arn:aws:rds:{region}:{account_id}:cluster-pg:{param_group}",
+                            'param_group': param_group
+                        })
+                    
                 except Exception as e:
                     self.logger.warning(f"Failed to get detailed info for RDS cluster {cluster_id}: {e}")
+            
+            parameters = {'region': region, 'account_id': account_id}
+            if self._write_component_rows(session, [
+                (RDS_CLUSTER_MEMBER_QUERY, member_rows, parameters),
+                (RDS_PARAMETER_GROUP_QUERY, param_group_rows, parameters)
+            ], "RDS components"):
+                self.stats['nodes_created'] += len(member_rows) + len(param_group_rows)
+                self.stats['relationships_created'] += 2 * (len(member_rows) + len(param_group_rows))
                     
         except Exception as e:
             self.logger.error(f"Failed to create RDS components: {e}")
     
-    def _create_elasticache_components(self, session, resources: Dict[str, Any]):
+    def _create_elasticache_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create ElastiCache sub-components: clusters, nodes, parameter groups"""
         try:
             elasticache_client = self.get_service_client('elasticache')
             if not elasticache_client:
                 return
                 
-            cache_clusters = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::ElastiCache::CacheCluster'
-            ]
+            cache_clusters = resources_by_type.get('AWS::ElastiCache::CacheCluster', [])
             
-            # Process Cache Clusters
+            if not cache_clusters:
+                return
+            
+            # Describe every cluster with its nodes in a few paginated calls
+            clusters_by_id = self._describe_all(
+                elasticache_client, 'describe_cache_clusters', 'CacheClusters', 'CacheClusterId',
+                ShowCacheNodeInfo=True
+            )
+            
+            region = self.config.region
+            account_id = self._get_account_id()
+            
+            # Process Cache Clusters, collecting node rows for batched writes
+            node_rows = []
             for cluster_arn, cluster_info in cache_clusters:
-                cluster_id = cluster_info.get('identifier', '')
+                cluster_id = cluster_info.identifier
                 if not cluster_id:
                     continue
                     
+                cluster = clusters_by_id.get(cluster_id)
+                if cluster is None:
+                    self.logger.debug("ElastiCache cluster %s not found in describe_cache_clusters", cluster_id)
+                    continue
+                
                 try:
-                    response = elasticache_client.describe_cache_clusters(
-                        CacheClusterId=cluster_id,
-                        ShowCacheNodeInfo=True
-                    )
-                    
-                    for cluster in response.get('CacheClusters', []):
-                        # Create cache nodes
-                        for node in cluster.get('CacheNodes', []):
-                            node_id = node.get('CacheNodeId')
-                            if node_id:
-                                node_arn = f"arn:aws:elasticache:{self.config.region}:{self._get_account_id()}:cachenode:{cluster_id}:{node_id}"
-                                node_properties = {
-                                    'arn': node_arn,
-                                    'node_id': node_id,
-                                    'cluster_id': cluster_id,
-                                    'node_status': node.get('CacheNodeStatus', ''),
-                                    'creation_time': str(node.get('CacheNodeCreateTime', '')),
-                                    'endpoint_address': node.get('Endpoint', {}).get('Address', ''),
-                                    'endpoint_port': node.get('Endpoint', {}).get('Port', 0),
-                                    'parameter_group_status': node.get('ParameterGroupStatus', ''),
-                                    'resource_type': 'AWS::ElastiCache::CacheNode',
-                                    'service': 'elasticache',
-                                    'region': self.config.region
-                                }
-                                node_properties = {k: v for k, v in node_properties.items() if v}
-                                
-                                node_query = """
-                                MERGE (node:ElastiCacheNode {arn: $arn})
-                                SET node += $properties
-                                """
-                                session.run(node_query, arn=node_arn, properties=node_properties)
-                                
-                                cluster_node_query = """
-                                MATCH (cluster:CacheCluster {arn: $cluster_arn})
-                                MATCH (node:ElastiCacheNode {arn: $node_arn})
-                                MERGE (cluster)-[:HAS_NODE]->(node)
-                                """
-                                session.run(cluster_node_query, cluster_arn=cluster_arn, node_arn=node_arn)
-                                self.stats['nodes_created'] += 1
-                                self.stats['relationships_created'] += 1
-                                
+                    # Cache nodes
+                    for node in cluster.get('CacheNodes', []):
+                        node_id = node.get('CacheNodeId')
+                        if node_id:
+                            node_arn = f"arn:aws:elasticache:{region}:{account_id}:cachenode:{cluster_id}:{node_id}"
+                            node_properties = {
+                                'arn': node_arn,
+                                'node_id': node_id,
+                                'cluster_id': cluster_id,
+                                'node_status': node.get('CacheNodeStatus', ''),
+                                'creation_time': str(node.get('CacheNodeCreateTime', '')),
+                                'endpoint_address': node.get('Endpoint', {}).get('Address', ''),
+                                'endpoint_port': node.get('Endpoint', {}).get('Port'),
+                                'parameter_group_status': node.get('ParameterGroupStatus', ''),
+                                'resource_type': 'AWS::ElastiCache::CacheNode',
+                                'service': 'elasticache',
+                                'region': region
+                            }
+                            node_rows.append({
+                                'arn': node_arn,
+                                'cluster_arn': cluster_arn,
+                                'properties': _clean_properties(node_properties)
+                            })
+                            
                 except Exception as e:
                     self.logger.warning(f"Failed to get detailed info for ElastiCache cluster {cluster_id}: {e}")
+            
+            if self._write_component_rows(session, [(ELASTICACHE_NODE_QUERY, node_rows, {})], "ElastiCache components"):
+                self.stats['nodes_created'] += len(node_rows)
+                self.stats['relationships_created'] += len(node_rows)
                     
         except Exception as e:
             self.logger.error(f"Failed to create ElastiCache components: {e}")
     
-    def _create_mq_components(self, session, resources: Dict[str, Any]):
+    def _create_mq_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create Amazon MQ sub-components: brokers, configurations, users"""
         try:
             mq_client = self.get_service_client('mq')
             if not mq_client:
                 return
                 
-            mq_brokers = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::MQ::Broker'
-            ]
+            mq_brokers = resources_by_type.get('AWS::MQ::Broker', [])
+            
+            region = self.config.region
+            account_id = self._get_account_id()
+            
+            # Describe all brokers up front, concurrently
+            responses = self._fetch_concurrently(
+                lambda broker_id: mq_client.describe_broker(BrokerId=broker_id),
+                [info.identifier for _, info in mq_brokers if info.identifier],
+                "MQ broker"
+            )
             
+            # Collect broker instance rows across all brokers for batched writes
+            instance_rows = []
             for broker_arn, broker_info in mq_brokers:
-                broker_id = broker_info.get('identifier', '')
-                if not broker_id:
+                broker_id = broker_info.identifier
+                response = responses.get(broker_id)
+                if response is None:
                     continue
                     
                 try:
-                    response = mq_client.describe_broker(BrokerId=broker_id)
-                    
-                    # Create broker instances
+                    # Broker instances
                     for instance in response.get('BrokerInstances', []):
                         instance_id = instance.get('ConsoleURL', '').split('/')[-1] if instance.get('ConsoleURL') else f"{broker_id}_instance"
-                        instance_arn = f"arn:aws:mq:{self.config.region}:{self._get_account_id()}:broker-instance:{broker_id}:{instance_id}"
+                        instance_arn = f"arn:aws:mq:{region}:{account_id}:broker-instance:{broker_id}:{instance_id}"
                         
                         instance_properties = {
                             'arn': instance_arn,
                             'broker_id': broker_id,
                             'console_url': instance.get('ConsoleURL', ''),
-                            'endpoints': str(instance.get('Endpoints', [])),
+                            # A list of URL strings, stored as a native list property
+                            'endpoints': instance.get('Endpoints') or None,
                             'ip_address': instance.get('IpAddress', ''),
                             'resource_type': 'AWS::MQ::BrokerInstance',
                             'service': 'mq',
-                            'region': self.config.region
+                            'region': region
                         }
-                        instance_properties = {k: v for k, v in instance_properties.items() if v}
-                        
-                        instance_query = """
-                        MERGE (instance:MQBrokerInstance {arn: $arn})
-                        SET instance += $properties
-                        """
-                        session.run(instance_query, arn=instance_arn, properties=instance_properties)
-                        
-                        broker_instance_query = """
-                        MATCH (broker:Broker {arn: $broker_arn})
-                        MATCH (instance:MQBrokerInstance {arn: $instance_arn})
-                        MERGE (broker)-[:HAS_INSTANCE]->(instance)
-                        """
-                        session.run(broker_instance_query, broker_arn=broker_arn, instance_arn=instance_arn)
-                        self.stats['nodes_created'] += 1
-                        self.stats['relationships_created'] += 1
+                        instance_rows.append({
+                            'arn': instance_arn,
+                            'broker_arn': broker_arn,
+                            'properties': _clean_properties(instance_properties)
+                        })
                         
                 except Exception as e:
-                    self.logger.warning(f"Failed to get detailed info for MQ broker {broker_id}: {e}")
+                    self.logger.warning(f"Failed to create components for MQ broker {broker_id}: {e}")
+            
+            if self._write_component_rows(session, [(MQ_BROKER_INSTANCE_QUERY, instance_rows, {})], "MQ components"):
+                self.stats['nodes_created'] += len(instance_rows)
+                self.stats['relationships_created'] += len(instance_rows)
                     
         except Exception as e:
             self.logger.error(f"Failed to create MQ components: {e}")
     
-    def _create_apigateway_components(self, session, resources: Dict[str, Any]):
+    def _create_apigateway_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create API Gateway sub-components: stages, resources, methods"""
         try:
             apigw_client = self.get_service_client('apigateway')
@@ -1086,24 +1493,31 @@ class Neo4jClient:
             if not apigw_client or not apigwv2_client:
                 return
                 
-            rest_apis = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::ApiGateway::RestApi'
-            ]
+            rest_apis = resources_by_type.get('AWS::ApiGateway::RestApi', [])
+            
+            region = self.config.region
+            
+            # Fetch the stages of all REST APIs (v1) up front, concurrently
+            stages_by_api = self._fetch_concurrently(
+                lambda api_id: apigw_client.get_stages(restApiId=api_id),
+                [info.identifier for _, info in rest_apis if info.identifier],
+                "API Gateway REST API"
+            )
             
-            # Process REST APIs (v1)
+            # Collect stage rows across all APIs for batched writes
+            stage_rows = []
             for api_arn, api_info in rest_apis:
-                api_id = api_info.get('identifier', '')
-                if not api_id:
+                api_id = api_info.identifier
+                stages_response = stages_by_api.get(api_id)
+                if stages_response is None:
                     continue
                     
                 try:
-                    # Create stages
-                    stages_response = apigw_client.get_stages(restApiId=api_id)
+                    # Stages
                     for stage in stages_response.get('item', []):
                         stage_name = stage.get('stageName')
                         if stage_name:
-                            stage_arn = f"arn:aws:apigateway:{self.config.region}::/restapis/{api_id}/stages/{stage_name}"
+                            stage_arn = f"arn:aws:apigateway:{region}::/restapis/{api_id}/stages/{stage_name}"
                             stage_properties = {
                                 'arn': stage_arn,
                                 'stage_name': stage_name,
@@ -1114,149 +1528,147 @@ class Neo4jClient:
                                 'created_date': str(stage.get('createdDate', '')),
                                 'resource_type': 'AWS::ApiGateway::Stage',
                                 'service': 'apigateway',
-                                'region': self.config.region
+                                'region': region
                             }
-                            stage_properties = {k: v for k, v in stage_properties.items() if v}
-                            
-                            stage_query = """
-                            MERGE (stage:ApiGatewayStage {arn: $arn})
-                            SET stage += $properties
-                            """
-                            session.run(stage_query, arn=stage_arn, properties=stage_properties)
-                            
-                            api_stage_query = """
-                            MATCH (api:RestApi {arn: $api_arn})
-                            MATCH (stage:ApiGatewayStage {arn: $stage_arn})
-                            MERGE (api)-[:HAS_STAGE]->(stage)
-                            """
-                            session.run(api_stage_query, api_arn=api_arn, stage_arn=stage_arn)
-                            self.stats['nodes_created'] += 1
-                            self.stats['relationships_created'] += 1
+                            stage_rows.append({
+                                'arn': stage_arn,
+                                'api_arn': api_arn,
+                                'properties': _clean_properties(stage_properties)
+                            })
                             
                 except Exception as e:
-                    self.logger.warning(f"Failed to get detailed info for API Gateway REST API {api_id}: {e}")
+                    self.logger.warning(f"Failed to create components for API Gateway REST API {api_id}: {e}")
+            
+            if self._write_component_rows(session, [(APIGATEWAY_STAGE_QUERY, stage_rows, {})], "API Gateway components"):
+                self.stats['nodes_created'] += len(stage_rows)
+                self.stats['relationships_created'] += len(stage_rows)
                     
         except Exception as e:
             self.logger.error(f"Failed to create API Gateway components: {e}")
     
-    def _create_transit_gateway_components(self, session, resources: Dict[str, Any]):
+    def _create_transit_gateway_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create Transit Gateway sub-components and detect cross-account connections"""
         try:
             ec2_client = self.get_service_client('ec2')
             if not ec2_client:
                 return
                 
-            transit_gateways = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::EC2::TransitGateway'
-            ]
+            transit_gateways = resources_by_type.get('AWS::EC2::TransitGateway', [])
+            
+            # Page through the VPC attachments of all transit gateways in chunked filter
+            # calls; a single unpaginated call per gateway only returned the first page
+            tgw_ids = [info.identifier for _, info in transit_gateways if info.identifier]
+            attachments_by_tgw = defaultdict(list)
+            paginator = ec2_client.get_paginator('describe_transit_gateway_vpc_attachments')
+            for start in range(0, len(tgw_ids), DESCRIBE_FILTER_BATCH_SIZE):
+                chunk = tgw_ids[start:start + DESCRIBE_FILTER_BATCH_SIZE]
+                try:
+                    for page in paginator.paginate(Filters=[{'Name': 'transit-gateway-id', 'Values': chunk}]):
+                        for attachment in page.get('TransitGatewayVpcAttachments', []):
+                            attachments_by_tgw[attachment.get('TransitGatewayId')].append(attachment)
+                except Exception as e:
+                    self.logger.warning(f"Failed to get VPC attachments for {len(chunk)} Transit Gateways: {e}")
             
+            current_account_id = self._get_account_id()
+            
+            connection_rows = []
             for tgw_arn, tgw_info in transit_gateways:
-                tgw_id = tgw_info.get('identifier', '')
+                tgw_id = tgw_info.identifier
                 if not tgw_id:
                     continue
                     
                 try:
                     # Check for cross-account VPC attachments
-                    vpc_attachments_response = ec2_client.describe_transit_gateway_vpc_attachments(
-                        Filters=[{'Name': 'transit-gateway-id', 'Values': [tgw_id]}]
-                    )
-                    
-                    for vpc_attachment in vpc_attachments_response.get('TransitGatewayVpcAttachments', []):
+                    for vpc_attachment in attachments_by_tgw.get(tgw_id, []):
                         vpc_owner_id = vpc_attachment.get('VpcOwnerId', '')
-                        current_account_id = self._get_account_id()
                         
                         if vpc_owner_id and vpc_owner_id != current_account_id:
-                            self.logger.info(f"Found cross-account Transit Gateway connection: {current_account_id} -> {vpc_owner_id}")
+                            self.logger.debug("Found cross-account Transit Gateway connection: %s -> %s", current_account_id, vpc_owner_id)
                             
-                            cross_account_query = """
-                            MERGE (source_account:Account {id: $source_account_id})
-                            MERGE (target_account:Account {id: $target_account_id})
-                            MERGE (source_account)-[:CONNECTED_VIA_TRANSIT_GATEWAY {
-                                transit_gateway_id: $tgw_id,
-                                attachment_id: $attachment_id,
-                                connection_type: 'Transit Gateway VPC Attachment',
-                                vpc_id: $vpc_id,
-                                created_at: datetime()
-                            }]->(target_account)
-                            """
-                            session.run(cross_account_query,
-                                       source_account_id=current_account_id,
-                                       target_account_id=vpc_owner_id,
-                                       tgw_id=tgw_id,
-                                       attachment_id=vpc_attachment.get('TransitGatewayAttachmentId', ''),
-                                       vpc_id=vpc_attachment.get('VpcId', ''))
-                            self.stats['cross_account_connections'] += 1
-                            self.stats['relationships_created'] += 1
+                            connection_rows.append({
+                                'target_account_id': vpc_owner_id,
+                                'tgw_id': tgw_id,
+                                'attachment_id': vpc_attachment.get('TransitGatewayAttachmentId', ''),
+                                'vpc_id': vpc_attachment.get('VpcId', '')
+                            })
                             
                 except Exception as e:
                     self.logger.warning(f"Failed to get detailed info for Transit Gateway {tgw_id}: {e}")
+            
+            if self._write_component_rows(session, [
+                (TGW_CROSS_ACCOUNT_QUERY, connection_rows, {'source_account_id': current_account_id})
+            ], "Transit Gateway connections"):
+                self.stats['cross_account_connections'] += len(connection_rows)
+                self.stats['relationships_created'] += len(connection_rows)
                     
         except Exception as e:
             self.logger.error(f"Failed to create Transit Gateway components: {e}")
     
-    def _create_vpc_peering_components(self, session, resources: Dict[str, Any]):
+    def _create_vpc_peering_components(self, session, resources_by_type: Dict[str, List[Tuple[str, ResourceInfo]]]):
         """Create VPC Peering connection components and detect cross-account connections"""
         try:
             ec2_client = self.get_service_client('ec2')
             if not ec2_client:
                 return
                 
-            peering_connections = [
-                (arn, info) for arn, info in resources.items() 
-                if info.get('resource_type') == 'AWS::EC2::VPCPeeringConnection'
-            ]
+            peering_connections = resources_by_type.get('AWS::EC2::VPCPeeringConnection', [])
+            
+            # Describe all peering connections in chunked, paginated filter calls
+            pcx_ids = [info.identifier for _, info in peering_connections if info.identifier]
+            described_connections = {}
+            for start in range(0, len(pcx_ids), DESCRIBE_FILTER_BATCH_SIZE):
+                chunk = pcx_ids[start:start + DESCRIBE_FILTER_BATCH_SIZE]
+                try:
+                    described_connections.update(self._describe_all(
+                        ec2_client, 'describe_vpc_peering_connections', 'VpcPeeringConnections',
+                        'VpcPeeringConnectionId',
+                        Filters=[{'Name': 'vpc-peering-connection-id', 'Values': chunk}]
+                    ))
+                except Exception as e:
+                    self.logger.warning(f"Failed to describe {len(chunk)} VPC Peering connections: {e}")
             
+            current_account_id = self._get_account_id()
+            
+            connection_rows = []
             for pcx_arn, pcx_info in peering_connections:
-                pcx_id = pcx_info.get('identifier', '')
-                if not pcx_id:
+                pcx_id = pcx_info.identifier
+                pcx = described_connections.get(pcx_id)
+                if pcx is None:
                     continue
                     
                 try:
-                    response = ec2_client.describe_vpc_peering_connections(VpcPeeringConnectionIds=[pcx_id])
+                    accepter_vpc_info = pcx.get('AccepterVpcInfo', {})
+                    requester_vpc_info = pcx.get('RequesterVpcInfo', {})
                     
-                    for pcx in response.get('VpcPeeringConnections', []):
-                        accepter_vpc_info = pcx.get('AccepterVpcInfo', {})
-                        requester_vpc_info = pcx.get('RequesterVpcInfo', {})
-                        
-                        accepter_owner_id = accepter_vpc_info.get('OwnerId', '')
-                        requester_owner_id = requester_vpc_info.get('OwnerId', '')
-                        current_account_id = self._get_account_id()
+                    accepter_owner_id = accepter_vpc_info.get('OwnerId', '')
+                    requester_owner_id = requester_vpc_info.get('OwnerId', '')
+                    
+                    # Check for cross-account connections
+                    cross_account_targets = []
+                    if accepter_owner_id and accepter_owner_id != current_account_id:
+                        cross_account_targets.append(accepter_owner_id)
+                    if requester_owner_id and requester_owner_id != current_account_id:
+                        cross_account_targets.append(requester_owner_id)
+                    
+                    for target_account_id in cross_account_targets:
+                        self.logger.debug("Found cross-account VPC Peering connection: %s -> %s", current_account_id, target_account_id)
                         
-                        # Check for cross-account connections
-                        cross_account_targets = []
-                        if accepter_owner_id and accepter_owner_id != current_account_id:
-                            cross_account_targets.append(accepter_owner_id)
-                        if requester_owner_id and requester_owner_id != current_account_id:
-                            cross_account_targets.append(requester_owner_id)
+                        connection_rows.append({
+                            'target_account_id': target_account_id,
+                            'pcx_id': pcx_id,
+                            'accepter_vpc_id': accepter_vpc_info.get('VpcId', ''),
+                            'requester_vpc_id': requester_vpc_info.get('VpcId', ''),
+                            'status': pcx.get('Status', {}).get('Code', '')
+                        })
                         
-                        for target_account_id in cross_account_targets:
-                            self.logger.info(f"Found cross-account VPC Peering connection: {current_account_id} -> {target_account_id}")
-                            
-                            cross_account_query = """
-                            MERGE (source_account:Account {id: $source_account_id})
-                            MERGE (target_account:Account {id: $target_account_id})
-                            MERGE (source_account)-[:CONNECTED_VIA_VPC_PEERING {
-                                peering_connection_id: $pcx_id,
-                                connection_type: 'VPC Peering Connection',
-                                accepter_vpc_id: $accepter_vpc_id,
-                                requester_vpc_id: $requester_vpc_id,
-                                status: $status,
-                                created_at: datetime()
-                            }]->(target_account)
-                            """
-                            session.run(cross_account_query,
-                                       source_account_id=current_account_id,
-                                       target_account_id=target_account_id,
-                                       pcx_id=pcx_id,
-                                       accepter_vpc_id=accepter_vpc_info.get('VpcId', ''),
-                                       requester_vpc_id=requester_vpc_info.get('VpcId', ''),
-                                       status=pcx.get('Status', {}).get('Code', ''))
-                            self.stats['cross_account_connections'] += 1
-                            self.stats['relationships_created'] += 1
-                            
                 except Exception as e:
-                    self.logger.warning(f"Failed to get detailed info for VPC Peering connection {pcx_id}: {e}")
+                    self.logger.warning(f"Failed to create components for VPC Peering connection {pcx_id}: {e}")
+            
+            if self._write_component_rows(session, [
+                (PCX_CROSS_ACCOUNT_QUERY, connection_rows, {'source_account_id': current_account_id})
+            ], "VPC Peering connections"):
+                self.stats['cross_account_connections'] += len(connection_rows)
+                self.stats['relationships_created'] += len(connection_rows)
                     
         except Exception as e:
             self.logger.error(f"Failed to create VPC Peering components: {e}")
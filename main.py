@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from core.config import DiscoveryConfig
 from core.discovery_engine import DiscoveryEngine
+from core.resource_config import load_resource_types_file
 
 # Import services to register them
 from services.ec2_service import EC2Service
@@ -45,9 +46,12 @@ Examples:
   # Exclude specific resource types from discovery
   python main.py --region us-east-1 --exclude "AWS::S3::Bucket" "AWS::EC2::Instance"
 
+  # Discover only the resource types listed in a file (one per line)
+  python main.py --region us-east-1 --resource-types-file my-types.txt
+
 Environment Variables:
   AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN - AWS credentials
-  NEO4J_URL, NEO4J_USER, NEO4J_PASSWORD - Neo4j connection details
+  NEO4J_URL, NEO4J_USER, NEO4J_PASSWORD, NEO4J_DATABASE - Neo4j connection details
   LOG_LEVEL - Logging level (DEBUG, INFO, WARNING, ERROR)
         """
     )
@@ -85,20 +89,30 @@ Environment Variables:
     discovery_group.add_argument(
         '--filter',
         dest='service_filter',
-        help='Filter discovery to specific service (e.g., "ec2", "s3", "iam")'
+        help='Filter discovery to specific service (e.g., "ec2", "s3", "iam") or to resource types '
+             'matching a pattern (e.g., "AWS::EC2::*")'
     )
     discovery_group.add_argument(
         '--exclude',
         nargs='+',
         help='Exclude specific resource types from discovery (e.g., "AWS::S3::Bucket" "AWS::EC2::Instance")'
     )
+    discovery_group.add_argument(
+        '--resource-types-file',
+        help='File with one resource type per line; only these types are discovered'
+    )
+    discovery_group.add_argument(
+        '--no-type-cache',
+        action='store_true',
+        help='Probe every resource type instead of skipping types cached as unsupported in the region'
+    )
     
     # Output Settings
     output_group = parser.add_argument_group('Output Settings')
     output_group.add_argument(
         '--output-formats',
         nargs='+',
-        choices=['json', 'csv', 'excel', 'html'],
+        choices=['json', 'jsonl', 'csv', 'excel', 'html'],
         default=['json'],
         help='Output formats to generate (default: json)'
     )
@@ -106,6 +120,12 @@ Environment Variables:
         '--output-dir',
         help='Custom output directory (default: timestamped directory)'
     )
+    output_group.add_argument(
+        '--compress-output',
+        action='store_true',
+        help='Gzip the JSON and JSONL exports (resources.json.gz, resources.jsonl.gz); '
+             'CSV, HTML and Excel exports are not compressed'
+    )
     
     # Neo4j Configuration
     neo4j_group = parser.add_argument_group('Neo4j Graph Database')
@@ -134,10 +154,21 @@ Environment Variables:
         default='Mh123456',
         help='Neo4j password (default: Mh123456)'
     )
+    neo4j_group.add_argument(
+        '--graph-db-name',
+        default='neo4j',
+        help='Neo4j database name (default: neo4j)'
+    )
     neo4j_group.add_argument(
         '--account-name',
         help='Custom account name for graph database (default: auto-generated)'
     )
+    neo4j_group.add_argument(
+        '--graph-writers',
+        type=int,
+        default=4,
+        help='Number of parallel Neo4j writer sessions (default: 4)'
+    )
     
     # Logging Configuration
     logging_group = parser.add_argument_group('Logging')
@@ -194,6 +225,14 @@ def validate_arguments(args) -> bool:
     if args.description_workers < 1:
         errors.append("--description-workers must be at least 1")
     
+    if args.graph_writers < 1:
+        errors.append("--graph-writers must be at least 1")
+    
+    # Validate resource types file
+    if args.resource_types_file:
+        if not Path(args.resource_types_file).is_file():
+            errors.append(f"--resource-types-file not found: {args.resource_types_file}")
+    
     # Validate Neo4j settings
     if args.reset_graph and not args.update_graph:
         errors.append("--reset-graph requires --update-graph")
@@ -248,6 +287,10 @@ def main():
     
     # Create configuration
     try:
+        resource_types = None
+        if args.resource_types_file:
+            resource_types = load_resource_types_file(args.resource_types_file)
+        
         config = DiscoveryConfig(
             region=args.region,
             profile=args.profile,
@@ -256,14 +299,19 @@ def main():
             individual_descriptions=args.individual_descriptions,
             service_filter=args.service_filter,
             exclude_resources=args.exclude,
+            resource_types=resource_types,
+            use_type_cache=not args.no_type_cache,
             output_formats=args.output_formats,
             output_dir=args.output_dir,
+            compress_output=args.compress_output,
             update_graph=args.update_graph,
             reset_graph=args.reset_graph,
             graph_db_url=args.graph_db_url,
             graph_db_user=args.graph_db_user,
             graph_db_password=args.graph_db_password,
+            graph_db_name=args.graph_db_name,
             account_name=args.account_name,
+            graph_writers=args.graph_writers,
             log_level=args.log_level,
             console_log_level=args.console_log_level,
             file_log_level=args.file_log_level
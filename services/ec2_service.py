@@ -7,6 +7,9 @@ from core.base_service import BaseAWSService
 from core.resource_info import ResourceInfo
 from .service_registry import register_service
 
+# Maximum number of IDs passed to a single EC2 describe call
+DESCRIBE_BATCH_SIZE = 100
+
 
 @register_service
 class EC2Service(BaseAWSService):
@@ -136,29 +139,14 @@ class EC2Service(BaseAWSService):
         """Discover all EC2 resources"""
         self.logger.info(f"🔍 Starting EC2 resource discovery in {self.region}")
         
-        all_resources = []
-        resource_types = self.get_supported_resource_types()
+        resource_types = self.get_resource_types_to_discover()
         
         self.logger.info(f"📋 Discovering {len(resource_types)} EC2 resource types")
         
-        for resource_type in resource_types:
-            try:
-                resources = self.discover_resource_type(resource_type)
-                all_resources.extend(resources)
-                
-                if resources:
-                    self.logger.debug(f"✓ {resource_type}: {len(resources)} resources")
-                
-            except Exception as e:
-                self.logger.error(f"✗ Failed to discover {resource_type}: {e}")
-                # Add error resource
-                error_resource = ResourceInfo(
-                    resource_type=resource_type,
-                    identifier="ERROR",
-                    error=str(e),
-                    region=self.region
-                )
-                all_resources.append(error_resource)
+        all_resources = self.discover_resource_types(resource_types)
+        
+        # Add the EC2 API details Cloud Control does not return for instances
+        self.get_enhanced_instances_info(all_resources)
         
         self.logger.info(f"🏁 EC2 discovery complete: {len(all_resources)} total resources")
         self.log_statistics()
@@ -170,36 +158,56 @@ class EC2Service(BaseAWSService):
         if resource_info.resource_type != "AWS::EC2::Instance":
             return resource_info
         
+        self.get_enhanced_instances_info([resource_info])
+        return resource_info
+    
+    def get_enhanced_instances_info(self, resources: List[ResourceInfo]) -> List[ResourceInfo]:
+        """Enhance EC2 instances in place, describing up to DESCRIBE_BATCH_SIZE instances per call.
+        
+        Instances are selected with an instance-id filter rather than InstanceIds, so an
+        instance terminated since it was listed is skipped instead of failing its batch.
+        """
+        instances = {
+            resource.identifier: resource for resource in resources
+            if resource.resource_type == "AWS::EC2::Instance" and not resource.has_error()
+        }
+        if not instances:
+            return resources
+        
+        instance_ids = list(instances)
         try:
-            ec2_client = self.get_client('ec2')
-            
-            # Get instance details
-            response = ec2_client.describe_instances(
-                InstanceIds=[resource_info.identifier]
-            )
-            
-            if response.get('Reservations'):
-                for reservation in response['Reservations']:
-                    for instance in reservation.get('Instances', []):
-                        if instance['InstanceId'] == resource_info.identifier:
-                            # Enhance properties with EC2 API data
-                            enhanced_properties = resource_info.properties.copy()
-                            enhanced_properties.update({
-                                'State': instance.get('State', {}),
-                                'InstanceType': instance.get('InstanceType', ''),
-                                'LaunchTime': str(instance.get('LaunchTime', '')),
-                                'VpcId': instance.get('VpcId', ''),
-                                'SubnetId': instance.get('SubnetId', ''),
-                                'PrivateIpAddress': instance.get('PrivateIpAddress', ''),
-                                'PublicIpAddress': instance.get('PublicIpAddress', ''),
-                                'SecurityGroups': instance.get('SecurityGroups', []),
-                                'Tags': instance.get('Tags', [])
-                            })
-                            
-                            resource_info.properties = enhanced_properties
-                            break
-            
+            paginator = self.get_client('ec2').get_paginator('describe_instances')
         except Exception as e:
-            self.logger.warning(f"Failed to enhance EC2 instance {resource_info.identifier}: {e}")
+            self.logger.warning(f"Failed to enhance {len(instance_ids)} EC2 instances: {e}")
+            return resources
+        
+        for start in range(0, len(instance_ids), DESCRIBE_BATCH_SIZE):
+            batch = instance_ids[start:start + DESCRIBE_BATCH_SIZE]
+            try:
+                reservations = paginator.paginate(
+                    Filters=[{'Name': 'instance-id', 'Values': batch}]
+                ).build_full_result().get('Reservations', [])
+            except Exception as e:
+                self.logger.warning(f"Failed to enhance {len(batch)} EC2 instances: {e}")
+                continue
+            
+            for reservation in reservations:
+                for instance in reservation.get('Instances', []):
+                    resource_info = instances.get(instance['InstanceId'])
+                    if resource_info is None:
+                        continue
+                    
+                    # Enhance properties with EC2 API data
+                    resource_info.properties.update({
+                        'State': instance.get('State', {}),
+                        'InstanceType': instance.get('InstanceType', ''),
+                        'LaunchTime': str(instance.get('LaunchTime', '')),
+                        'VpcId': instance.get('VpcId', ''),
+                        'SubnetId': instance.get('SubnetId', ''),
+                        'PrivateIpAddress': instance.get('PrivateIpAddress', ''),
+                        'PublicIpAddress': instance.get('PublicIpAddress', ''),
+                        'SecurityGroups': instance.get('SecurityGroups', []),
+                        'Tags': instance.get('Tags', [])
+                    })
         
-        return resource_info
\ No newline at end of file
+        return resources
@@ -8,12 +8,67 @@ discovery across all 600+ AWS resource types.
 
 from typing import List, Dict, Set, Any
 from collections import defaultdict
+from itertools import zip_longest
 from core.base_service import BaseAWSService
 from core.resource_info import ResourceInfo
-from core.resource_config import get_resource_config
+from core.resource_config import get_resource_config, is_type_pattern
 from .service_registry import register_service
 
 
+# Resource types already handled by dedicated services
+EC2_TYPES = frozenset([
+    "AWS::EC2::CapacityReservation", "AWS::EC2::CapacityReservationFleet", "AWS::EC2::CarrierGateway",
+    "AWS::EC2::CustomerGateway", "AWS::EC2::DHCPOptions", "AWS::EC2::EC2Fleet", "AWS::EC2::EIP",
+    "AWS::EC2::EIPAssociation", "AWS::EC2::EgressOnlyInternetGateway", "AWS::EC2::EnclaveCertificateIamRoleAssociation",
+    "AWS::EC2::FlowLog", "AWS::EC2::GatewayRouteTableAssociation", "AWS::EC2::Host", "AWS::EC2::IPAM",
+    "AWS::EC2::IPAMAllocation", "AWS::EC2::IPAMPool", "AWS::EC2::IPAMPoolCidr", "AWS::EC2::IPAMResourceDiscovery",
+    "AWS::EC2::IPAMResourceDiscoveryAssociation", "AWS::EC2::IPAMScope", "AWS::EC2::Instance",
+    "AWS::EC2::InstanceConnectEndpoint", "AWS::EC2::InternetGateway", "AWS::EC2::KeyPair",
+    "AWS::EC2::LaunchTemplate", "AWS::EC2::LocalGatewayRoute", "AWS::EC2::LocalGatewayRouteTable",
+    "AWS::EC2::LocalGatewayRouteTableVPCAssociation", "AWS::EC2::LocalGatewayRouteTableVirtualInterfaceGroupAssociation",
+    "AWS::EC2::NatGateway", "AWS::EC2::NetworkAcl", "AWS::EC2::NetworkInsightsAccessScope",
+    "AWS::EC2::NetworkInsightsAccessScopeAnalysis", "AWS::EC2::NetworkInsightsAnalysis", "AWS::EC2::NetworkInsightsPath",
+    "AWS::EC2::NetworkInterface", "AWS::EC2::NetworkInterfaceAttachment", "AWS::EC2::NetworkPerformanceMetricSubscription",
+    "AWS::EC2::PlacementGroup", "AWS::EC2::PrefixList", "AWS::EC2::Route", "AWS::EC2::RouteServer",
+    "AWS::EC2::RouteServerAssociation", "AWS::EC2::RouteServerEndpoint", "AWS::EC2::RouteServerPeer",
+    "AWS::EC2::RouteServerPropagation", "AWS::EC2::RouteTable", "AWS::EC2::SecurityGroup",
+    "AWS::EC2::SecurityGroupEgress", "AWS::EC2::SecurityGroupIngress", "AWS::EC2::SecurityGroupVpcAssociation",
+    "AWS::EC2::SnapshotBlockPublicAccess", "AWS::EC2::SpotFleet", "AWS::EC2::Subnet", "AWS::EC2::SubnetCidrBlock",
+    "AWS::EC2::SubnetNetworkAclAssociation", "AWS::EC2::SubnetRouteTableAssociation", "AWS::EC2::TransitGateway",
+    "AWS::EC2::TransitGatewayAttachment", "AWS::EC2::TransitGatewayConnect", "AWS::EC2::TransitGatewayMulticastDomain",
+    "AWS::EC2::TransitGatewayMulticastDomainAssociation", "AWS::EC2::TransitGatewayMulticastGroupMember",
+    "AWS::EC2::TransitGatewayMulticastGroupSource", "AWS::EC2::TransitGatewayPeeringAttachment",
+    "AWS::EC2::TransitGatewayRoute", "AWS::EC2::TransitGatewayRouteTable", "AWS::EC2::TransitGatewayRouteTableAssociation",
+    "AWS::EC2::TransitGatewayRouteTablePropagation", "AWS::EC2::TransitGatewayVpcAttachment", "AWS::EC2::VPC",
+    "AWS::EC2::VPCBlockPublicAccessExclusion", "AWS::EC2::VPCBlockPublicAccessOptions", "AWS::EC2::VPCCidrBlock",
+    "AWS::EC2::VPCDHCPOptionsAssociation", "AWS::EC2::VPCEndpoint", "AWS::EC2::VPCEndpointConnectionNotification",
+    "AWS::EC2::VPCEndpointService", "AWS::EC2::VPCEndpointServicePermissions", "AWS::EC2::VPCGatewayAttachment",
+    "AWS::EC2::VPCPeeringConnection", "AWS::EC2::VPNConnection", "AWS::EC2::VPNConnectionRoute",
+    "AWS::EC2::VPNGateway", "AWS::EC2::VerifiedAccessEndpoint", "AWS::EC2::VerifiedAccessGroup",
+    "AWS::EC2::VerifiedAccessInstance", "AWS::EC2::VerifiedAccessTrustProvider", "AWS::EC2::Volume",
+    "AWS::EC2::VolumeAttachment"
+])
+
+S3_TYPES = frozenset([
+    "AWS::S3::AccessGrant", "AWS::S3::AccessGrantsInstance", "AWS::S3::AccessGrantsLocation",
+    "AWS::S3::AccessPoint", "AWS::S3::Bucket", "AWS::S3::BucketPolicy", "AWS::S3::MultiRegionAccessPoint",
+    "AWS::S3::MultiRegionAccessPointPolicy", "AWS::S3::StorageLens", "AWS::S3::StorageLensGroup",
+    "AWS::S3Express::AccessPoint", "AWS::S3Express::BucketPolicy", "AWS::S3Express::DirectoryBucket",
+    "AWS::S3ObjectLambda::AccessPoint", "AWS::S3ObjectLambda::AccessPointPolicy", "AWS::S3Outposts::AccessPoint",
+    "AWS::S3Outposts::Bucket", "AWS::S3Outposts::BucketPolicy", "AWS::S3Outposts::Endpoint",
+    "AWS::S3Tables::TableBucket", "AWS::S3Tables::TableBucketPolicy"
+])
+
+IAM_TYPES = frozenset([
+    "AWS::IAM::Group", "AWS::IAM::GroupPolicy", "AWS::IAM::InstanceProfile", "AWS::IAM::ManagedPolicy",
+    "AWS::IAM::OIDCProvider", "AWS::IAM::Role", "AWS::IAM::RolePolicy", "AWS::IAM::SAMLProvider",
+    "AWS::IAM::ServerCertificate", "AWS::IAM::ServiceLinkedRole", "AWS::IAM::User", "AWS::IAM::UserPolicy",
+    "AWS::IAM::VirtualMFADevice"
+])
+
+DEDICATED_SERVICE_TYPES = EC2_TYPES | S3_TYPES | IAM_TYPES
+
+
 @register_service
 class GeneralAWSService(BaseAWSService):
     """General AWS service discovery implementation for all remaining resource types"""
@@ -37,60 +92,8 @@ class GeneralAWSService(BaseAWSService):
         config = get_resource_config()
         all_resource_types = config.get_all_resource_types()
         
-        # Resource types already handled by dedicated services
-        ec2_types = set([
-            "AWS::EC2::CapacityReservation", "AWS::EC2::CapacityReservationFleet", "AWS::EC2::CarrierGateway",
-            "AWS::EC2::CustomerGateway", "AWS::EC2::DHCPOptions", "AWS::EC2::EC2Fleet", "AWS::EC2::EIP",
-            "AWS::EC2::EIPAssociation", "AWS::EC2::EgressOnlyInternetGateway", "AWS::EC2::EnclaveCertificateIamRoleAssociation",
-            "AWS::EC2::FlowLog", "AWS::EC2::GatewayRouteTableAssociation", "AWS::EC2::Host", "AWS::EC2::IPAM",
-            "AWS::EC2::IPAMAllocation", "AWS::EC2::IPAMPool", "AWS::EC2::IPAMPoolCidr", "AWS::EC2::IPAMResourceDiscovery",
-            "AWS::EC2::IPAMResourceDiscoveryAssociation", "AWS::EC2::IPAMScope", "AWS::EC2::Instance",
-            "AWS::EC2::InstanceConnectEndpoint", "AWS::EC2::InternetGateway", "AWS::EC2::KeyPair",
-            "AWS::EC2::LaunchTemplate", "AWS::EC2::LocalGatewayRoute", "AWS::EC2::LocalGatewayRouteTable",
-            "AWS::EC2::LocalGatewayRouteTableVPCAssociation", "AWS::EC2::LocalGatewayRouteTableVirtualInterfaceGroupAssociation",
-            "AWS::EC2::NatGateway", "AWS::EC2::NetworkAcl", "AWS::EC2::NetworkInsightsAccessScope",
-            "AWS::EC2::NetworkInsightsAccessScopeAnalysis", "AWS::EC2::NetworkInsightsAnalysis", "AWS::EC2::NetworkInsightsPath",
-            "AWS::EC2::NetworkInterface", "AWS::EC2::NetworkInterfaceAttachment", "AWS::EC2::NetworkPerformanceMetricSubscription",
-            "AWS::EC2::PlacementGroup", "AWS::EC2::PrefixList", "AWS::EC2::Route", "AWS::EC2::RouteServer",
-            "AWS::EC2::RouteServerAssociation", "AWS::EC2::RouteServerEndpoint", "AWS::EC2::RouteServerPeer",
-            "AWS::EC2::RouteServerPropagation", "AWS::EC2::RouteTable", "AWS::EC2::SecurityGroup",
-            "AWS::EC2::SecurityGroupEgress", "AWS::EC2::SecurityGroupIngress", "AWS::EC2::SecurityGroupVpcAssociation",
-            "AWS::EC2::SnapshotBlockPublicAccess", "AWS::EC2::SpotFleet", "AWS::EC2::Subnet", "AWS::EC2::SubnetCidrBlock",
-            "AWS::EC2::SubnetNetworkAclAssociation", "AWS::EC2::SubnetRouteTableAssociation", "AWS::EC2::TransitGateway",
-            "AWS::EC2::TransitGatewayAttachment", "AWS::EC2::TransitGatewayConnect", "AWS::EC2::TransitGatewayMulticastDomain",
-            "AWS::EC2::TransitGatewayMulticastDomainAssociation", "AWS::EC2::TransitGatewayMulticastGroupMember",
-            "AWS::EC2::TransitGatewayMulticastGroupSource", "AWS::EC2::TransitGatewayPeeringAttachment",
-            "AWS::EC2::TransitGatewayRoute", "AWS::EC2::TransitGatewayRouteTable", "AWS::EC2::TransitGatewayRouteTableAssociation",
-            "AWS::EC2::TransitGatewayRouteTablePropagation", "AWS::EC2::TransitGatewayVpcAttachment", "AWS::EC2::VPC",
-            "AWS::EC2::VPCBlockPublicAccessExclusion", "AWS::EC2::VPCBlockPublicAccessOptions", "AWS::EC2::VPCCidrBlock",
-            "AWS::EC2::VPCDHCPOptionsAssociation", "AWS::EC2::VPCEndpoint", "AWS::EC2::VPCEndpointConnectionNotification",
-            "AWS::EC2::VPCEndpointService", "AWS::EC2::VPCEndpointServicePermissions", "AWS::EC2::VPCGatewayAttachment",
-            "AWS::EC2::VPCPeeringConnection", "AWS::EC2::VPNConnection", "AWS::EC2::VPNConnectionRoute",
-            "AWS::EC2::VPNGateway", "AWS::EC2::VerifiedAccessEndpoint", "AWS::EC2::VerifiedAccessGroup",
-            "AWS::EC2::VerifiedAccessInstance", "AWS::EC2::VerifiedAccessTrustProvider", "AWS::EC2::Volume",
-            "AWS::EC2::VolumeAttachment"
-        ])
-        
-        s3_types = set([
-            "AWS::S3::AccessGrant", "AWS::S3::AccessGrantsInstance", "AWS::S3::AccessGrantsLocation",
-            "AWS::S3::AccessPoint", "AWS::S3::Bucket", "AWS::S3::BucketPolicy", "AWS::S3::MultiRegionAccessPoint",
-            "AWS::S3::MultiRegionAccessPointPolicy", "AWS::S3::StorageLens", "AWS::S3::StorageLensGroup",
-            "AWS::S3Express::AccessPoint", "AWS::S3Express::BucketPolicy", "AWS::S3Express::DirectoryBucket",
-            "AWS::S3ObjectLambda::AccessPoint", "AWS::S3ObjectLambda::AccessPointPolicy", "AWS::S3Outposts::AccessPoint",
-            "AWS::S3Outposts::Bucket", "AWS::S3Outposts::BucketPolicy", "AWS::S3Outposts::Endpoint",
-            "AWS::S3Tables::TableBucket", "AWS::S3Tables::TableBucketPolicy"
-        ])
-        
-        iam_types = set([
-            "AWS::IAM::Group", "AWS::IAM::GroupPolicy", "AWS::IAM::InstanceProfile", "AWS::IAM::ManagedPolicy",
-            "AWS::IAM::OIDCProvider", "AWS::IAM::Role", "AWS::IAM::RolePolicy", "AWS::IAM::SAMLProvider",
-            "AWS::IAM::ServerCertificate", "AWS::IAM::ServiceLinkedRole", "AWS::IAM::User", "AWS::IAM::UserPolicy",
-            "AWS::IAM::VirtualMFADevice"
-        ])
-        
         # Filter out resource types handled by dedicated services
-        excluded_types = ec2_types | s3_types | iam_types
-        remaining_types = [rt for rt in all_resource_types if rt not in excluded_types]
+        remaining_types = [rt for rt in all_resource_types if rt not in DEDICATED_SERVICE_TYPES]
         
         return remaining_types
     
@@ -98,7 +101,7 @@ class GeneralAWSService(BaseAWSService):
         """Organize resource types by AWS service prefix for better management"""
         service_groups = defaultdict(list)
         
-        for resource_type in self.get_supported_resource_types():
+        for resource_type in self.get_resource_types_to_discover():
             # Extract service prefix (e.g., "AutoScaling" from "AWS::AutoScaling::LaunchConfiguration")
             parts = resource_type.split("::")
             if len(parts) >= 3:
@@ -107,6 +110,16 @@ class GeneralAWSService(BaseAWSService):
         
         return dict(service_groups)
     
+    def _interleave_resource_types(self, service_names: List[str]) -> List[str]:
+        """
+        Order resource types round-robin across services.
+        
+        Consecutive workers then call different AWS services instead of queueing
+        behind one service's throttling limits.
+        """
+        groups = [self._resource_groups[name] for name in service_names]
+        return [rt for batch in zip_longest(*groups) for rt in batch if rt is not None]
+    
     def get_available_services(self) -> List[str]:
         """Get list of AWS services that have discoverable resources"""
         return list(self._resource_groups.keys())
@@ -116,6 +129,11 @@ class GeneralAWSService(BaseAWSService):
         if not service_filter:
             return True
         
+        # Resource type patterns are applied to the configured types, which the
+        # resource groups were built from
+        if is_type_pattern(service_filter):
+            return bool(self._resource_groups)
+        
         service_filter = service_filter.lower()
         
         # Check against service name
@@ -148,26 +166,34 @@ class GeneralAWSService(BaseAWSService):
             'resources_discovered': 0
         }
         
-        # Discover from all services
+        # Discover all resource types in one concurrent batch, then report per service
+        # Sort services alphabetically for consistent output
+        service_names = sorted(self.get_available_services())
+        resource_types = self._interleave_resource_types(service_names)
+        
+        self.logger.info(f"📋 Discovering {len(resource_types)} resource types across {len(service_names)} services")
+        resources_by_type = self.discover_resource_types_by_type(resource_types)
+        
         all_resources = []
         
-        # Sort services alphabetically for consistent output
-        for service_name in sorted(self.get_available_services()):
+        for service_name in service_names:
             try:
-                self.logger.info(f"🔍 Discovering {service_name} resources...")
                 discovery_stats['services_processed'] += 1
                 
-                service_resources = self._discover_service_resources(service_name)
+                service_resources = []
+                for resource_type in self._resource_groups[service_name]:
+                    service_resources.extend(resources_by_type.get(resource_type, []))
                 
                 if service_resources:
-                    valid_resources = [r for r in service_resources if not r.error]
-                    error_resources = [r for r in service_resources if r.error]
+                    # Count instead of building throwaway valid/error lists
+                    error_count = sum(1 for r in service_resources if r.error)
+                    valid_count = len(service_resources) - error_count
                     
                     all_resources.extend(service_resources)
                     discovery_stats['resources_discovered'] += len(service_resources)
                     discovery_stats['services_successful'] += 1
                     
-                    self.logger.info(f"✅ {service_name}: {len(valid_resources)} resources, {len(error_resources)} errors")
+                    self.logger.info(f"✅ {service_name}: {valid_count} resources, {error_count} errors")
                 else:
                     self.logger.info(f"⚫ {service_name}: No resources found")
                     discovery_stats['services_successful'] += 1
@@ -212,29 +238,12 @@ class GeneralAWSService(BaseAWSService):
             return []
         
         # Get resource types for this service
-        service_resources = []
         resource_types = self._resource_groups[service_name]
+        service_resources = self.discover_resource_types(resource_types)
         
-        for resource_type in resource_types:
-            try:
-                # Use parent class method to discover resources of this type
-                resources = super().discover_resources_by_type(resource_type)
-                service_resources.extend(resources)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed to discover {resource_type}: {e}")
-                # Create error resource for tracking
-                error_resource = ResourceInfo(
-                    resource_type=resource_type,
-                    identifier="discovery-error",
-                    region=self.config.region,
-                    error=str(e)
-                )
-                service_resources.append(error_resource)
-        
-        valid_resources = [r for r in service_resources if not r.error]
-        if valid_resources:
-            self.logger.debug(f"🔍 {service_name}: Found {len(valid_resources)} resources across {len(resource_types)} types")
+        valid_count = sum(1 for r in service_resources if not r.error)
+        if valid_count:
+            self.logger.debug("🔍 %s: Found %s resources across %s types", service_name, valid_count, len(resource_types))
         
         return service_resources
     
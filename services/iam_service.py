@@ -8,10 +8,24 @@ from core.resource_info import ResourceInfo
 from .service_registry import register_service
 
 
+# Largest page the IAM list APIs accept, so most lookups finish in one call
+IAM_PAGE_SIZE = 1000
+
+
 @register_service
 class IAMService(BaseAWSService):
     """IAM service discovery implementation"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Resource type -> enhancer, looked up once per resource
+        self._enhancers = {
+            "AWS::IAM::Role": self._enhance_role,
+            "AWS::IAM::User": self._enhance_user,
+            "AWS::IAM::Policy": self._enhance_policy,
+        }
+    
     def get_service_name(self) -> str:
         return "iam"
     
@@ -53,29 +67,11 @@ class IAMService(BaseAWSService):
         """Discover all IAM resources"""
         self.logger.info("🔍 Starting IAM resource discovery (global service)")
         
-        all_resources = []
-        resource_types = self.get_supported_resource_types()
+        resource_types = self.get_resource_types_to_discover()
         
         self.logger.info(f"📋 Discovering {len(resource_types)} IAM resource types")
         
-        for resource_type in resource_types:
-            try:
-                resources = self.discover_resource_type(resource_type)
-                all_resources.extend(resources)
-                
-                if resources:
-                    self.logger.debug(f"✓ {resource_type}: {len(resources)} resources")
-                
-            except Exception as e:
-                self.logger.error(f"✗ Failed to discover {resource_type}: {e}")
-                # Add error resource
-                error_resource = ResourceInfo(
-                    resource_type=resource_type,
-                    identifier="ERROR",
-                    error=str(e),
-                    region=""  # IAM is global
-                )
-                all_resources.append(error_resource)
+        all_resources = self.discover_resource_types(resource_types)
         
         # Enhance IAM resources with additional information
         enhanced_resources = []
@@ -93,83 +89,94 @@ class IAMService(BaseAWSService):
     
     def get_enhanced_iam_info(self, resource_info: ResourceInfo) -> ResourceInfo:
         """Get enhanced information for IAM resources using direct IAM API"""
+        enhancer = self._enhancers.get(resource_info.resource_type)
+        if enhancer is None:
+            return resource_info
+        
         try:
             iam_client = self.get_client('iam')
-            enhanced_properties = resource_info.properties.copy()
+            enhancer(iam_client, resource_info, resource_info.properties)
             
-            # Enhance based on resource type
-            if resource_info.resource_type == "AWS::IAM::Role":
-                role_name = resource_info.identifier
-                try:
-                    role_response = iam_client.get_role(RoleName=role_name)
-                    role_data = role_response['Role']
-                    
-                    enhanced_properties.update({
-                        'CreateDate': str(role_data.get('CreateDate', '')),
-                        'MaxSessionDuration': role_data.get('MaxSessionDuration', 0),
-                        'Path': role_data.get('Path', '/'),
-                        'AssumeRolePolicyDocument': role_data.get('AssumeRolePolicyDocument', {}),
-                        'Tags': role_data.get('Tags', [])
-                    })
-                    
-                    # Get attached policies
-                    try:
-                        policies_response = iam_client.list_attached_role_policies(RoleName=role_name)
-                        enhanced_properties['AttachedManagedPolicies'] = policies_response.get('AttachedPolicies', [])
-                    except Exception as e:
-                        self.logger.debug(f"Failed to get attached policies for role {role_name}: {e}")
-                    
-                except Exception as e:
-                    self.logger.debug(f"Failed to enhance IAM role {role_name}: {e}")
+        except Exception as e:
+            self.logger.warning(f"Failed to enhance IAM resource {resource_info.identifier}: {e}")
+        
+        return resource_info
+    
+    def _enhance_role(self, iam_client, resource_info: ResourceInfo, enhanced_properties: Dict):
+        """Add role details and attached managed policies"""
+        role_name = resource_info.identifier
+        try:
+            role_response = iam_client.get_role(RoleName=role_name)
+            role_data = role_response['Role']
             
-            elif resource_info.resource_type == "AWS::IAM::User":
-                user_name = resource_info.identifier
-                try:
-                    user_response = iam_client.get_user(UserName=user_name)
-                    user_data = user_response['User']
-                    
-                    enhanced_properties.update({
-                        'CreateDate': str(user_data.get('CreateDate', '')),
-                        'Path': user_data.get('Path', '/'),
-                        'PasswordLastUsed': str(user_data.get('PasswordLastUsed', '')),
-                        'Tags': user_data.get('Tags', [])
-                    })
-                    
-                    # Get user groups
-                    try:
-                        groups_response = iam_client.get_groups_for_user(UserName=user_name)
-                        enhanced_properties['Groups'] = [g['GroupName'] for g in groups_response.get('Groups', [])]
-                    except Exception as e:
-                        self.logger.debug(f"Failed to get groups for user {user_name}: {e}")
-                    
-                except Exception as e:
-                    self.logger.debug(f"Failed to enhance IAM user {user_name}: {e}")
+            enhanced_properties.update({
+                'CreateDate': str(role_data.get('CreateDate', '')),
+                'MaxSessionDuration': role_data.get('MaxSessionDuration', 0),
+                'Path': role_data.get('Path', '/'),
+                'AssumeRolePolicyDocument': role_data.get('AssumeRolePolicyDocument', {}),
+                'Tags': role_data.get('Tags', [])
+            })
             
-            elif resource_info.resource_type == "AWS::IAM::Policy":
-                policy_arn = resource_info.arn or resource_info.identifier
-                try:
-                    policy_response = iam_client.get_policy(PolicyArn=policy_arn)
-                    policy_data = policy_response['Policy']
-                    
-                    enhanced_properties.update({
-                        'CreateDate': str(policy_data.get('CreateDate', '')),
-                        'UpdateDate': str(policy_data.get('UpdateDate', '')),
-                        'AttachmentCount': policy_data.get('AttachmentCount', 0),
-                        'IsAttachable': policy_data.get('IsAttachable', False),
-                        'Path': policy_data.get('Path', '/'),
-                        'DefaultVersionId': policy_data.get('DefaultVersionId', ''),
-                        'Tags': policy_data.get('Tags', [])
-                    })
-                    
-                except Exception as e:
-                    self.logger.debug(f"Failed to enhance IAM policy {policy_arn}: {e}")
+            # Get attached policies
+            try:
+                # Paginate so roles with more than one page of attachments are not truncated
+                policies_response = iam_client.get_paginator('list_attached_role_policies').paginate(
+                    RoleName=role_name,
+                    PaginationConfig={'PageSize': IAM_PAGE_SIZE}
+                ).build_full_result()
+                enhanced_properties['AttachedManagedPolicies'] = policies_response.get('AttachedPolicies', [])
+            except Exception as e:
+                self.logger.debug("Failed to get attached policies for role %s: %s", role_name, e)
             
-            resource_info.properties = enhanced_properties
+        except Exception as e:
+            self.logger.debug("Failed to enhance IAM role %s: %s", role_name, e)
+    
+    def _enhance_user(self, iam_client, resource_info: ResourceInfo, enhanced_properties: Dict):
+        """Add user details and group memberships"""
+        user_name = resource_info.identifier
+        try:
+            user_response = iam_client.get_user(UserName=user_name)
+            user_data = user_response['User']
+            
+            enhanced_properties.update({
+                'CreateDate': str(user_data.get('CreateDate', '')),
+                'Path': user_data.get('Path', '/'),
+                'PasswordLastUsed': str(user_data.get('PasswordLastUsed', '')),
+                'Tags': user_data.get('Tags', [])
+            })
+            
+            # Get user groups
+            try:
+                groups_response = iam_client.get_paginator('list_groups_for_user').paginate(
+                    UserName=user_name,
+                    PaginationConfig={'PageSize': IAM_PAGE_SIZE}
+                ).build_full_result()
+                enhanced_properties['Groups'] = [g['GroupName'] for g in groups_response.get('Groups', [])]
+            except Exception as e:
+                self.logger.debug("Failed to get groups for user %s: %s", user_name, e)
             
         except Exception as e:
-            self.logger.warning(f"Failed to enhance IAM resource {resource_info.identifier}: {e}")
-        
-        return resource_info
+            self.logger.debug("Failed to enhance IAM user %s: %s", user_name, e)
+    
+    def _enhance_policy(self, iam_client, resource_info: ResourceInfo, enhanced_properties: Dict):
+        """Add managed policy details"""
+        policy_arn = resource_info.arn or resource_info.identifier
+        try:
+            policy_response = iam_client.get_policy(PolicyArn=policy_arn)
+            policy_data = policy_response['Policy']
+            
+            enhanced_properties.update({
+                'CreateDate': str(policy_data.get('CreateDate', '')),
+                'UpdateDate': str(policy_data.get('UpdateDate', '')),
+                'AttachmentCount': policy_data.get('AttachmentCount', 0),
+                'IsAttachable': policy_data.get('IsAttachable', False),
+                'Path': policy_data.get('Path', '/'),
+                'DefaultVersionId': policy_data.get('DefaultVersionId', ''),
+                'Tags': policy_data.get('Tags', [])
+            })
+            
+        except Exception as e:
+            self.logger.debug("Failed to enhance IAM policy %s: %s", policy_arn, e)
     
     def is_global_service(self) -> bool:
         """IAM is a global service"""
@@ -3,11 +3,19 @@ S3 service implementation for AWS resource discovery.
 """
 
 from typing import List, Dict
-from core.base_service import BaseAWSService
+from botocore.exceptions import ClientError
+from core.base_service import BaseAWSService, get_type_executor
 from core.resource_info import ResourceInfo
 from .service_registry import register_service
 
 
+# Error codes S3 returns when an optional bucket configuration is simply not set
+S3_NOT_CONFIGURED_ERROR_CODES = frozenset({
+    'ServerSideEncryptionConfigurationNotFoundError',
+    'NoSuchPublicAccessBlockConfiguration',
+})
+
+
 @register_service
 class S3Service(BaseAWSService):
     """S3 service discovery implementation"""
@@ -65,29 +73,11 @@ class S3Service(BaseAWSService):
         """Discover all S3 resources"""
         self.logger.info(f"🔍 Starting S3 resource discovery in {self.region}")
         
-        all_resources = []
-        resource_types = self.get_supported_resource_types()
+        resource_types = self.get_resource_types_to_discover()
         
         self.logger.info(f"📋 Discovering {len(resource_types)} S3 resource types")
         
-        for resource_type in resource_types:
-            try:
-                resources = self.discover_resource_type(resource_type)
-                all_resources.extend(resources)
-                
-                if resources:
-                    self.logger.debug(f"✓ {resource_type}: {len(resources)} resources")
-                
-            except Exception as e:
-                self.logger.error(f"✗ Failed to discover {resource_type}: {e}")
-                # Add error resource
-                error_resource = ResourceInfo(
-                    resource_type=resource_type,
-                    identifier="ERROR",
-                    error=str(e),
-                    region=self.region
-                )
-                all_resources.append(error_resource)
+        all_resources = self.discover_resource_types(resource_types)
         
         # Enhance S3 bucket information
         enhanced_resources = []
@@ -112,53 +102,69 @@ class S3Service(BaseAWSService):
             s3_client = self.get_client('s3')
             bucket_name = resource_info.identifier
             
-            enhanced_properties = resource_info.properties.copy()
+            # The parsed properties belong to this resource, so update them in place
+            enhanced_properties = resource_info.properties
+            
+            # The bucket calls are independent, so issue them all at once on the
+            # shared pool and wait for the slowest instead of their sum
+            executor = get_type_executor(self.config.max_workers)
+            location_future = executor.submit(s3_client.get_bucket_location, Bucket=bucket_name)
+            encryption_future = executor.submit(s3_client.get_bucket_encryption, Bucket=bucket_name)
+            versioning_future = executor.submit(s3_client.get_bucket_versioning, Bucket=bucket_name)
+            public_access_block_future = executor.submit(s3_client.get_public_access_block, Bucket=bucket_name)
+            logging_future = executor.submit(s3_client.get_bucket_logging, Bucket=bucket_name)
             
             # Get bucket location
             try:
-                location = s3_client.get_bucket_location(Bucket=bucket_name)
+                location = location_future.result()
                 enhanced_properties['LocationConstraint'] = location.get('LocationConstraint', 'us-east-1')
-            except Exception as e:
-                self.logger.debug(f"Failed to get location for bucket {bucket_name}: {e}")
+            except ClientError as e:
+                self.logger.debug("Failed to get location for bucket %s: %s", bucket_name, e)
             
             # Get bucket encryption
             try:
-                encryption = s3_client.get_bucket_encryption(Bucket=bucket_name)
+                encryption = encryption_future.result()
                 enhanced_properties['Encryption'] = encryption.get('ServerSideEncryptionConfiguration', {})
-            except Exception as e:
-                self.logger.debug(f"No encryption config for bucket {bucket_name}: {e}")
+            except ClientError as e:
+                self._log_bucket_config_error("encryption config", bucket_name, e)
             
             # Get bucket versioning
             try:
-                versioning = s3_client.get_bucket_versioning(Bucket=bucket_name)
+                versioning = versioning_future.result()
                 enhanced_properties['Versioning'] = {
                     'Status': versioning.get('Status', 'Disabled'),
                     'MfaDelete': versioning.get('MfaDelete', 'Disabled')
                 }
-            except Exception as e:
-                self.logger.debug(f"Failed to get versioning for bucket {bucket_name}: {e}")
+            except ClientError as e:
+                self.logger.debug("Failed to get versioning for bucket %s: %s", bucket_name, e)
             
             # Get bucket public access block
             try:
-                public_access_block = s3_client.get_public_access_block(Bucket=bucket_name)
+                public_access_block = public_access_block_future.result()
                 enhanced_properties['PublicAccessBlockConfiguration'] = public_access_block.get('PublicAccessBlockConfiguration', {})
-            except Exception as e:
-                self.logger.debug(f"No public access block for bucket {bucket_name}: {e}")
+            except ClientError as e:
+                self._log_bucket_config_error("public access block", bucket_name, e)
             
             # Get bucket logging
             try:
-                logging_config = s3_client.get_bucket_logging(Bucket=bucket_name)
+                logging_config = logging_future.result()
                 enhanced_properties['LoggingConfiguration'] = logging_config.get('LoggingEnabled', {})
-            except Exception as e:
-                self.logger.debug(f"No logging config for bucket {bucket_name}: {e}")
-            
-            resource_info.properties = enhanced_properties
+            except ClientError as e:
+                self.logger.debug("Failed to get logging config for bucket %s: %s", bucket_name, e)
             
         except Exception as e:
             self.logger.warning(f"Failed to enhance S3 bucket {resource_info.identifier}: {e}")
         
         return resource_info
     
+    def _log_bucket_config_error(self, config_name: str, bucket_name: str, error: ClientError):
+        """Log a failed optional bucket lookup, staying quiet when the configuration is just absent"""
+        error_code = error.response.get('Error', {}).get('Code', 'Unknown')
+        if error_code in S3_NOT_CONFIGURED_ERROR_CODES:
+            self.logger.debug("No %s for bucket %s", config_name, bucket_name)
+        else:
+            self.logger.warning(f"Failed to get {config_name} for bucket {bucket_name}: {error_code}")
+    
     def is_global_service(self) -> bool:
         """S3 bucket names are global but buckets exist in specific regions"""
         return False  # S3 buckets are region-specific even though names are global
\ No newline at end of file
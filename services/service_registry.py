@@ -8,6 +8,7 @@ import boto3
 
 from core.base_service import BaseAWSService
 from core.config import DiscoveryConfig
+from core.resource_config import is_type_pattern
 
 
 class ServiceRegistry:
@@ -63,7 +64,11 @@ class ServiceRegistry:
         return services
     
     def get_filtered_services(self, service_filter: str, config: DiscoveryConfig, session: boto3.Session) -> List[BaseAWSService]:
-        """Get services filtered by service name pattern"""
+        """Get services filtered by service name, or by a resource type pattern such as AWS::EC2::*"""
+        if is_type_pattern(service_filter):
+            # The pattern already narrowed the configured types; keep services with types left
+            return [s for s in self.get_all_services(config, session) if s.get_resource_types_to_discover()]
+        
         services = []
         filter_lower = service_filter.lower()
         
@@ -149,10 +154,16 @@ class ServiceFactory:
         """Get services based on configuration filters"""
         if self.config.service_filter:
             self.logger.info(f"Filtering services by: {self.config.service_filter}")
-            return self.create_filtered_services(self.config.service_filter)
+            services = self.create_filtered_services(self.config.service_filter)
         else:
             self.logger.info("Discovering all services")
-            return self.create_all_services()
+            services = self.create_all_services()
+        
+        # With an explicit resource type list, skip services that have nothing left to discover
+        if self.config.resource_types is not None:
+            services = [s for s in services if s.get_resource_types_to_discover()]
+        
+        return services
     
     def log_available_services(self):
         """Log information about available services"""
@@ -0,0 +1,58 @@
+"""
+JSON helpers for AWS resource discovery.
+
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Favour speed over ratio; JSON inventories still shrink roughly tenfold
+GZIP_COMPRESS_LEVEL = 6
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON string or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string, stringifying unknown types"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(',', ':'))
+
+
+def dump_to_file(obj: Any, path: Union[str, Path], indent: bool = True, compress: bool = False):
+    """Serialize an object straight to a file, indented by two spaces unless indent is False,
+    and gzip-compressed when compress is True"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(obj, default=str, option=option)
+        if compress:
+            with gzip.open(path, 'wb', compresslevel=GZIP_COMPRESS_LEVEL) as f:
+                f.write(data)
+        else:
+            with open(path, 'wb') as f:
+                f.write(data)
+        return
+    
+    if compress:
+        f = gzip.open(path, 'wt', compresslevel=GZIP_COMPRESS_LEVEL, encoding='utf-8')
+    else:
+        f = open(path, 'w', encoding='utf-8')
+    with f:
+        json.dump(obj, f, indent=2 if indent else None, default=str, ensure_ascii=False)
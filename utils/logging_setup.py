@@ -3,11 +3,18 @@ Centralized logging setup for AWS resource discovery.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
 
+# Background listener that drains queued log records to the real handlers
+_queue_listener = None
+
+
 def setup_logging(
     log_level: str = "INFO",
     console_level: str = "INFO", 
@@ -33,10 +40,13 @@ def setup_logging(
     logger = logging.getLogger(logger_name)
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Clear any existing handlers
+    # Stop a listener left over from a previous setup and clear any existing handlers
+    shutdown_logging(logger_name)
     logger.handlers.clear()
     logger.propagate = False
     
+    handlers = []
+    
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -51,7 +61,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, console_level.upper()))
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (if log file specified)
     if log_file:
@@ -61,11 +71,45 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(getattr(logging, file_level.upper()))
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Drop records below every handler's level at the logger, before a record is
+    # built and queued only to be discarded by the listener
+    logger.setLevel(max(logger.level, min(handler.level for handler in handlers)))
+    
+    # Worker threads only enqueue records; a single listener thread does the I/O
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     return logger
 
 
+def shutdown_logging(logger_name: str = "aws_discovery"):
+    """
+    Flush queued log records and stop the background listener.
+    
+    The listener's handlers are attached directly to the logger afterwards so
+    anything logged later is still written.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    
+    listener = _queue_listener
+    _queue_listener = None
+    listener.stop()
+    
+    logger = logging.getLogger(logger_name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+
+
 def setup_service_logger(service_name: str, parent_logger: str = "aws_discovery") -> logging.Logger:
     """
     Setup logger for a specific service.
@@ -128,12 +172,15 @@ def log_configuration(logger: logging.Logger, config):
     logger.info(f"   Profile: {config.profile or 'default'}")
     logger.info(f"   Max Workers: {config.max_workers}")
     logger.info(f"   Service Filter: {config.service_filter or 'none'}")
+    if config.resource_types is not None:
+        logger.info(f"   Resource Types: {len(config.resource_types)} from file")
     logger.info(f"   Output Formats: {', '.join(config.output_formats)}")
     logger.info(f"   Individual Descriptions: {config.individual_descriptions}")
     
     if config.is_neo4j_enabled():
-        logger.info(f"   Neo4j: {config.graph_db_url}")
+        logger.info(f"   Neo4j: {config.graph_db_url} (database: {config.graph_db_name})")
         logger.info(f"   Reset Graph: {config.reset_graph}")
+        logger.info(f"   Graph Writers: {config.graph_writers}")
 
 
 def configure_third_party_loggers():
@@ -153,24 +200,34 @@ def configure_third_party_loggers():
 class ProgressLogger:
     """Logger for tracking progress of long-running operations"""
     
-    def __init__(self, logger: logging.Logger, total_items: int, operation_name: str = "Processing"):
+    def __init__(self, logger: logging.Logger, total_items: int, operation_name: str = "Processing",
+                 log_every_percent: int = 10):
         self.logger = logger
         self.total_items = total_items
         self.operation_name = operation_name
         self.processed_items = 0
-        self.last_logged_percentage = 0
+        # Items between progress lines; compared as integers on every update
+        self._log_step = max(1, -(-total_items * log_every_percent // 100))
+        self._next_log_at = self._log_step
+        # Worker threads may share one progress logger
+        self._lock = threading.Lock()
     
     def update(self, increment: int = 1):
         """Update progress and log if significant progress made"""
-        self.processed_items += increment
+        with self._lock:
+            self.processed_items += increment
+            processed_items = self.processed_items
+            
+            # Log every log_every_percent or at completion
+            if processed_items < self._next_log_at and processed_items != self.total_items:
+                return
+            
+            while self._next_log_at <= processed_items:
+                self._next_log_at += self._log_step
         
         if self.total_items > 0:
-            percentage = (self.processed_items / self.total_items) * 100
-            
-            # Log every 10% or at completion
-            if (percentage - self.last_logged_percentage >= 10) or self.processed_items == self.total_items:
-                self.logger.info(f"📈 {self.operation_name}: {self.processed_items}/{self.total_items} ({percentage:.1f}%)")
-                self.last_logged_percentage = percentage
+            percentage = (processed_items / self.total_items) * 100
+            self.logger.info(f"📈 {self.operation_name}: {processed_items}/{self.total_items} ({percentage:.1f}%)")
     
     def complete(self):
         """Mark operation as complete"""